@@ -3,6 +3,10 @@ import os
 import sys
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Files at or above this size share one serial queue so they don't compete for disk bandwidth
+LARGE_FILE_MB = 5120
 
 def generate_test_data(size_mb, distribution, output_path=None):
     """Generate a test data file with the given parameters"""
@@ -28,12 +32,35 @@ def generate_test_data(size_mb, distribution, output_path=None):
     elapsed = time.time() - start_time
     
     if result.returncode == 0:
-        print(f"✅ Generated in {elapsed:.2f} seconds")
+        print(f"✅ Generated {size_mb}MB {distribution} in {elapsed:.2f} seconds")
         return True
     else:
-        print(f"❌ Error: {result.stderr}")
+        print(f"❌ Error generating {size_mb}MB {distribution}: {result.stderr}")
         return False
 
+def generate_serially(configs):
+    """Generate the given files one after another, returning one result per file"""
+    return [generate_test_data(size_mb, distribution) for size_mb, distribution in configs]
+
+def parse_jobs(args):
+    """Remove a --jobs N (or --jobs=N) option from args and return the job count"""
+    jobs = min(4, os.cpu_count() or 1)
+    for i, arg in enumerate(args):
+        if arg == "--jobs" and i + 1 < len(args):
+            value = args[i + 1]
+            del args[i:i + 2]
+        elif arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+            del args[i]
+        else:
+            continue
+        try:
+            jobs = max(1, int(value))
+        except ValueError:
+            print(f"Invalid job count: {value}. Using {jobs} instead.")
+        break
+    return jobs
+
 def main():
     """Generate all test data files needed for testing"""
     # Define the sizes and distributions we need
@@ -61,23 +88,26 @@ def main():
     ]
     
     # Check if specific configs were requested
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "all":
+    args = sys.argv[1:]
+    jobs = parse_jobs(args)
+    
+    if len(args) > 0:
+        if args[0] == "all":
             pass  # Use the default configs above
-        elif sys.argv[1] == "baseline":
+        elif args[0] == "baseline":
             # Just generate the baseline 1GB uniform file
             data_configs = [(1024, "uniform")]
-        elif sys.argv[1] == "quick":
+        elif args[0] == "quick":
             # Just generate smaller files for quick testing
             data_configs = [(1, "uniform"), (10, "uniform"), (100, "uniform")]
-        elif sys.argv[1] == "large":
+        elif args[0] == "large":
             # Just generate larger files for data size tests
             data_configs = [(1024, "uniform"), (2048, "uniform"), (5120, "uniform"), (10240, "uniform")]
         else:
             try:
                 # Format: size distribution
-                size_mb = int(sys.argv[1])
-                distribution = sys.argv[2] if len(sys.argv) > 2 else "uniform"
+                size_mb = int(args[0])
+                distribution = args[1] if len(args) > 1 else "uniform"
                 
                 # Validate distribution
                 if distribution not in ["uniform", "skewed"]:
@@ -87,20 +117,29 @@ def main():
                     
                 data_configs = [(size_mb, distribution)]
             except ValueError:
-                print(f"Invalid size: {sys.argv[1]}. Using default configs.")
+                print(f"Invalid size: {args[0]}. Using default configs.")
     
     # Generate all the required data files
-    print(f"Will generate {len(data_configs)} data files")
+    print(f"Will generate {len(data_configs)} data files using up to {jobs} parallel jobs")
     print("Note: Large files may take a long time to generate\n")
     
-    successful = 0
-    failed = 0
+    # Small files run in parallel; large files are generated one at a time in a single job
+    small_configs = [c for c in data_configs if c[0] < LARGE_FILE_MB]
+    large_configs = [c for c in data_configs if c[0] >= LARGE_FILE_MB]
     
-    for size_mb, distribution in data_configs:
-        if generate_test_data(size_mb, distribution):
-            successful += 1
-        else:
-            failed += 1
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(generate_test_data, size_mb, distribution)
+                   for size_mb, distribution in small_configs]
+        if large_configs:
+            futures.append(executor.submit(generate_serially, large_configs))
+        
+        for future in as_completed(futures):
+            result = future.result()
+            results.extend(result if isinstance(result, list) else [result])
+    
+    successful = sum(1 for r in results if r)
+    failed = len(results) - successful
     
     # Print summary
     print("\n==============================")
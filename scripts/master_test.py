@@ -1,19 +1,32 @@
 #!/usr/bin/env python3
 import os
+import atexit
+import asyncio
+import contextlib
 import sys
 import time
 import subprocess
-import random
-import struct
 import signal
 import csv
 import json
 import datetime
+import hashlib
+import io
+import itertools
 import re
-import matplotlib.pyplot as plt
+import select
+import socket
+import numpy as np
 import threading
 import shutil
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from script_utils import wait_with_backoff
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Fall back to killall/pkill for process cleanup
 
 # Get the absolute paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,6 +39,57 @@ PLOTS_DIR = os.path.join(PROJECT_ROOT, "plots")
 # Enable/disable debug output
 DEBUG_MODE = True
 
+# Key/value range for generated data and queries (non-negative signed 64-bit)
+MAX_KEY = 2**63 - 1
+# Boundary of the "hot" 20% of the key space used by the skewed distribution
+SKEW_SPLIT_KEY = int(0.2 * MAX_KEY)
+# Records generated per chunk when writing data files (16MB per chunk)
+GENERATE_CHUNK_RECORDS = 1024 * 1024
+# Seed for generated data files so cached files can be reused across runs
+DATA_SEED = 42
+# Manifest recording the generated data files that can be reused
+DATA_MANIFEST_PATH = os.path.join(DATA_DIR, "manifest.json")
+# Port the server listens on when started without arguments (DEFAULT_PORT in include/constants.h)
+SERVER_PORT = 9090
+# Connections the server accepts at once (MAX_CLIENTS in include/constants.h)
+SERVER_MAX_CLIENTS = 64
+# Seconds between readiness probes while the server is starting
+SERVER_PROBE_INTERVAL = 0.005
+# Seconds between flushes of the server log file
+LOG_FLUSH_INTERVAL = 0.2
+
+# Port of the server this process drives; parallel dimension workers each get their own
+server_port = SERVER_PORT
+# Private directory of a parallel dimension worker, None when the dimensions run one at a time
+dimension_worker_dir = None
+# Parallel dimensions time their servers side by side on one machine, so each skews the others' numbers
+PARALLEL_RESULTS_WARNING = ("dimensions were tested in parallel; throughput and latency figures "
+                            "are not comparable with serial runs")
+
+# Metrics reported by the server's stats command; each group name is the metrics key it fills
+STATS_METRICS_PATTERN = re.compile(
+    r'Reads:\s*(?P<read_runtime_per_op>[\d.]+)\s*ms/op'          # Average operation times
+    r'|Writes:\s*(?P<write_runtime_per_op>[\d.]+)\s*ms/op'
+    r'|Reads:\s*(?P<read_throughput>[\d.]+)\s*ops/sec'           # Throughput
+    r'|Writes:\s*(?P<write_throughput>[\d.]+)\s*ops/sec'
+    r'|Read I/Os:\s*(?P<read_ios>[\d.]+)'                         # I/O counts
+    r'|Write I/Os:\s*(?P<write_ios>[\d.]+)'
+)
+
+# Metrics drawn by generate_plots, gathered into one column each
+PLOT_METRICS = (
+    'read_ios', 'write_ios',
+    'throughput', 'read_throughput', 'write_throughput',
+    'runtime_per_op', 'read_runtime_per_op', 'write_runtime_per_op',
+    'runtime', 'cache_misses'
+)
+
+# Runtime per op is drawn on a log scale only when its values span at least this factor
+RUNTIME_LOG_SCALE_SPAN = 10
+
+# Plots are rewritten every run, so trade a little file size for much faster PNG encoding
+PNG_SAVE_KWARGS = {"pil_kwargs": {"compress_level": 1}}
+
 # Global tracker for bulk load completions
 class BulkLoadTracker:
     def __init__(self):
@@ -49,10 +113,88 @@ class BulkLoadTracker:
         with self.lock:
             if data_file in self.success_events:
                 del self.success_events[data_file]
+    
+    def signal_all(self):
+        """Set every active completion event"""
+        # Only snapshot under the lock so the monitors don't serialize on the event wakeups
+        with self.lock:
+            events = list(self.success_events.values())
+        for event in events:
+            event.set()
 
 # Create global instance
 bulk_load_tracker = BulkLoadTracker()
 
+# Long-lived connection used for control commands such as stats checks. It speaks the
+# server's text protocol directly instead of going through the client binary.
+class ControlClient:
+    # Terminates the welcome message, each command and each response (CMD_DELIMITER in include/constants.h)
+    DELIMITER = b"\r\n"
+
+    def __init__(self):
+        self.sock = None
+        self.buffer = b""
+        self.lock = threading.Lock()
+
+    def connect(self, timeout):
+        """Connect to the server and consume its welcome message"""
+        self.sock = socket.create_connection(("127.0.0.1", server_port), timeout=timeout)
+        self.buffer = b""
+        welcome = self._read_response(time.monotonic() + timeout)
+        debug_print(f"Control connection established: {welcome}")
+
+    def send(self, command, timeout=10):
+        """Send a command and return the server's response, or None if the connection failed"""
+        with self.lock:
+            deadline = time.monotonic() + timeout
+            try:
+                if self.sock is None:
+                    self.connect(timeout)
+                self.sock.sendall(command.encode() + self.DELIMITER)
+                return self._read_response(deadline)
+            except OSError as e:
+                # Covers refused connections, timeouts and the server closing the connection
+                debug_print(f"Control command '{command}' failed: {e}")
+                self._close()
+                return None
+
+    def _read_response(self, deadline):
+        while True:
+            end = self.buffer.find(self.DELIMITER)
+            if end != -1:
+                response = self.buffer[:end]
+                self.buffer = self.buffer[end + len(self.DELIMITER):]
+                return response.decode(errors='replace')
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out waiting for response")
+            self.sock.settimeout(remaining)
+            chunk = self.sock.recv(1 << 16)
+            if not chunk:
+                raise ConnectionResetError("connection closed by server")
+            self.buffer += chunk
+
+    def close(self):
+        """Disconnect from the server"""
+        with self.lock:
+            self._close()
+
+    def _close(self):
+        if self.sock is None:
+            return
+        try:
+            self.sock.sendall(b"q" + self.DELIMITER)
+        except OSError:
+            pass  # Server already gone
+        self.sock.close()
+        self.sock = None
+        self.buffer = b""
+
+# Create global instance; disconnect cleanly on exit
+control_client = ControlClient()
+atexit.register(control_client.close)
+
 # Default/baseline configuration
 BASELINE = {
     "buffer_size": 4 * 1024 * 1024,  # 4MB
@@ -133,12 +275,83 @@ TEST_CONFIGS = {
     }
 }
 
+# Dimension names accepted by --dimensions
+DIM_CHOICES = frozenset(TEST_CONFIGS)
+
+# Create the results and plot directories once; everything below writes into them
+os.makedirs(RESULTS_DIR, exist_ok=True)
+for dimension_config in TEST_CONFIGS.values():
+    os.makedirs(dimension_config["plot_dir"], exist_ok=True)
+
+# Sequence number appended to output file timestamps
+output_sequence = itertools.count()
+
+def output_timestamp():
+    """Timestamp for output file names; the sequence number keeps runs within the same second apart"""
+    return f"{time.strftime('%Y%m%d_%H%M%S')}_{next(output_sequence)}"
+
+def write_file_bytes(path, data):
+    """Write bytes to a file with raw os.write calls, bypassing Python's buffered IO"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked for, so keep going until everything is out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 def debug_print(message):
     """Print debug message if debug mode is enabled"""
     if DEBUG_MODE:
         timestamp = time.strftime("%H:%M:%S")
         print(f"[DEBUG {timestamp}] {message}")
 
+def load_data_manifest():
+    """Load the manifest of previously generated data files"""
+    try:
+        with open(DATA_MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_data_manifest():
+    """Atomically write the data file manifest"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    tmp_path = DATA_MANIFEST_PATH + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data_manifest, f, indent=2)
+    os.replace(tmp_path, DATA_MANIFEST_PATH)
+
+def data_file_fingerprint(path):
+    """Cheap fingerprint of a data file: SHA-1 of its first and last MB"""
+    chunk = 1024 * 1024
+    size = os.path.getsize(path)
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        digest.update(f.read(chunk))
+        if size > chunk:
+            f.seek(max(chunk, size - chunk))
+            digest.update(f.read(chunk))
+    return digest.hexdigest()
+
+# Generated data files keyed by (size, distribution, seed)
+data_manifest = load_data_manifest()
+# With --no-cache, the manifest keys generated during this run; only those files may be reused
+fresh_data_keys = None
+
+def generate_keys(n, distribution, rng):
+    """Generate n keys following a data or query distribution as a uint64 array"""
+    if distribution == "skewed":
+        # Skewed distribution - 80% of keys in lower 20% of key space,
+        # 20% of keys in the rest of key space
+        in_hot_range = rng.random(n) < 0.8
+        hot_keys = rng.integers(0, SKEW_SPLIT_KEY, size=n, dtype=np.uint64, endpoint=True)
+        cold_keys = rng.integers(SKEW_SPLIT_KEY, MAX_KEY, size=n, dtype=np.uint64, endpoint=True)
+        return np.where(in_hot_range, hot_keys, cold_keys)
+    # Uniform distribution - completely random keys
+    return rng.integers(0, MAX_KEY, size=n, dtype=np.uint64, endpoint=True)
+
 def generate_test_data(size_bytes, distribution="uniform"):
     """Generate test data file with specified size and distribution"""
     os.makedirs(DATA_DIR, exist_ok=True)
@@ -148,65 +361,202 @@ def generate_test_data(size_bytes, distribution="uniform"):
     
     # Create output file path
     output_file = os.path.join(DATA_DIR, f"{int(size_kb)}kb_{distribution}.bin")
-    
-    # If file already exists with correct size, use it
-    if os.path.exists(output_file) and os.path.getsize(output_file) >= size_bytes:
-        debug_print(f"Using existing {int(size_kb)}KB {distribution} data file")
-        return output_file
+    manifest_key = f"{size_bytes}:{distribution}:{DATA_SEED}"
+    
+    # If the file was generated before and hasn't changed since, use it
+    reuse_allowed = fresh_data_keys is None or manifest_key in fresh_data_keys
+    if reuse_allowed and os.path.exists(output_file) and os.path.getsize(output_file) >= size_bytes:
+        entry = data_manifest.get(manifest_key)
+        fingerprint = data_file_fingerprint(output_file)
+        if entry is None:
+            # File from an earlier run without a manifest entry - adopt it
+            data_manifest[manifest_key] = {
+                "path": output_file,
+                "size": os.path.getsize(output_file),
+                "fingerprint": fingerprint
+            }
+            save_data_manifest()
+            entry = data_manifest[manifest_key]
+        
+        if entry["size"] == os.path.getsize(output_file) and entry["fingerprint"] == fingerprint:
+            debug_print(f"Using existing {int(size_kb)}KB {distribution} data file")
+            return output_file
+        
+        debug_print(f"Existing {int(size_kb)}KB {distribution} data file doesn't match manifest, regenerating")
     
     debug_print(f"Generating {int(size_kb)}KB {distribution} data file with {records_count:,} records")
     
-    # Generate the data based on distribution
-    with open(output_file, 'wb') as f:
-        if distribution == "uniform":
-            # Uniform distribution - completely random keys
-            for i in range(records_count):
-                key = random.randint(0, 2**63 - 1)
-                value = random.randint(0, 2**63 - 1)
-                f.write(struct.pack("<QQ", key, value))
-        elif distribution == "skewed":
-            # Skewed distribution - 80% of keys in 20% of key space
-            for i in range(records_count):
-                if random.random() < 0.8:
-                    # 80% of keys in lower 20% of key space
-                    key = random.randint(0, int(0.2 * (2**63 - 1)))
-                else:
-                    # 20% of keys in the rest of key space
-                    key = random.randint(int(0.2 * (2**63 - 1)), 2**63 - 1)
-                value = random.randint(0, 2**63 - 1)
-                f.write(struct.pack("<QQ", key, value))
+    # Generate the data based on distribution, one chunk of records at a time, writing each chunk
+    # straight to the file descriptor without going through Python's buffered IO.
+    # The file is preallocated, so it is built under a temporary name and only renamed into place
+    # once complete; an interrupted run must never leave a full-size file of zeros to be reused.
+    rng = np.random.default_rng(DATA_SEED)
+    tmp_file = output_file + ".tmp"
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if distribution in ("uniform", "skewed"):
+            # Reserve the whole file up front so it is laid out contiguously
+            try:
+                os.posix_fallocate(fd, 0, records_count * 16)
+            except (AttributeError, OSError):
+                pass  # Not supported on this platform/filesystem
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        remaining = records_count
+        while remaining > 0:
+            n = min(remaining, GENERATE_CHUNK_RECORDS)
+            records = np.empty((n, 2), dtype='<u8')
+            
+            if distribution not in ("uniform", "skewed"):
+                debug_print(f"Unknown distribution '{distribution}', no records generated")
+                break
+            
+            records[:, 0] = generate_keys(n, distribution, rng)
+            
+            records[:, 1] = rng.integers(0, MAX_KEY, size=n, dtype=np.uint64, endpoint=True)
+            
+            # os.write may write less than asked for, so keep going until the chunk is out
+            view = memoryview(records).cast('B')
+            while view:
+                view = view[os.write(fd, view):]
+            remaining -= n
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_file)
+        raise
+    os.close(fd)
+    os.replace(tmp_file, output_file)
     
     # Verify the file size
     actual_size = os.path.getsize(output_file)
     debug_print(f"Generated file size: {actual_size / 1024:.2f}KB")
     
+    # Record the file so later runs can reuse it
+    if fresh_data_keys is not None:
+        fresh_data_keys.add(manifest_key)
+    data_manifest[manifest_key] = {
+        "path": output_file,
+        "size": actual_size,
+        "fingerprint": data_file_fingerprint(output_file)
+    }
+    save_data_manifest()
+    
     return output_file
 
+def find_server_processes():
+    """Find running LSM-tree server processes"""
+    server_procs = []
+    for proc in psutil.process_iter(['name', 'cmdline', 'status']):
+        if proc.info['status'] == psutil.STATUS_ZOMBIE:
+            continue  # Already dead, just not reaped yet
+        cmdline = proc.info['cmdline'] or []
+        if proc.info['name'] == "server" or (cmdline and cmdline[0].endswith("bin/server")):
+            # A dimension worker must leave the servers of the other workers alone
+            if dimension_worker_dir is not None and cmdline[1:2] != [str(server_port)]:
+                continue
+            server_procs.append(proc)
+    return server_procs
+
 def cleanup_processes():
     """Kill any server processes that might be running"""
+    # The control client's connection dies with the server
+    control_client.close()
+    
     try:
-        # Use both killall and pkill for better reliability
-        subprocess.run("killall server 2>/dev/null || true", shell=True)
-        subprocess.run("pkill -f 'bin/server' 2>/dev/null || true", shell=True)
-        
-        # Give processes time to terminate
-        time.sleep(1)
+        if psutil is None:
+            # A dimension worker only matches the server on its own port
+            pattern = "bin/server" if dimension_worker_dir is None else f"bin/server {server_port}$"
+            
+            # Use both killall and pkill for better reliability
+            if dimension_worker_dir is None:
+                subprocess.run("killall server 2>/dev/null || true", shell=True)
+            subprocess.run(f"pkill -f '{pattern}' 2>/dev/null || true", shell=True)
+            
+            def servers_gone():
+                return subprocess.run(["pgrep", "-f", pattern], stdout=subprocess.DEVNULL).returncode != 0
+            
+            # Give processes up to a second to terminate, force killing any that are still running
+            if not wait_with_backoff(servers_gone, 1.0):
+                print("Some server processes still running, using SIGKILL...")
+                subprocess.run(f"pkill -9 -f '{pattern}' 2>/dev/null || true", shell=True)
+                wait_with_backoff(servers_gone, 1.0)
+        else:
+            # Signal the servers directly and only wait as long as they take to exit
+            server_procs = find_server_processes()
+            for proc in server_procs:
+                try:
+                    proc.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+            
+            _, alive = psutil.wait_procs(server_procs, timeout=1)
+            if alive:
+                print("Some server processes still running, using SIGKILL...")
+                for proc in alive:
+                    try:
+                        proc.kill()
+                    except psutil.NoSuchProcess:
+                        pass
+                psutil.wait_procs(alive, timeout=1)
         
-        # Check if any processes are still running and force kill if needed
-        if subprocess.run("pgrep -f 'bin/server'", shell=True, stdout=subprocess.PIPE).returncode == 0:
-            print("Some server processes still running, using SIGKILL...")
-            subprocess.run("pkill -9 -f 'bin/server' 2>/dev/null || true", shell=True)
-            time.sleep(1)
+        # The next server can only start once the old one's port is free again
+        if not wait_for_port_free():
+            print(f"Port {server_port} is still in use after cleanup")
         
         print("Cleaned up any existing server processes")
     except Exception as e:
         print(f"Error during process cleanup: {e}")
         # Continue execution even if cleanup fails
 
+# Servers started by start_server and not yet stopped, killed on exit by kill_live_servers
+live_servers = set()
+
+def kill_live_servers():
+    """Kill the sessions of every server still running when the script exits"""
+    for server_proc in list(live_servers):
+        kill_server_session(server_proc)
+
+atexit.register(kill_live_servers)
+
+def kill_server_session(server_proc):
+    """Kill the session of a server started by start_server if it is still running"""
+    if server_proc.poll() is None:
+        try:
+            os.killpg(server_proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        server_proc.wait()
+
+def server_accepting_connections(port=None):
+    """Check whether the server's listen socket accepts connections"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex(("127.0.0.1", server_port if port is None else port)) == 0
+
+def wait_for_port_free(port=None, timeout=5):
+    """Wait until the server port can be bound again, returning whether it became free"""
+    port = server_port if port is None else port
+    deadline = time.monotonic() + timeout
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # Bind the way the server does, so connections left in TIME_WAIT don't count as in use
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("", port))
+                return True
+            except OSError:
+                pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(SERVER_PROBE_INTERVAL)
+
 def start_server(env_vars=None):
     """Start the LSM-tree server with specified parameters"""
     print("\nStarting LSM-tree server...")
     
+    # Don't let a client connected to a previous server outlive it
+    control_client.close()
+    
     # Set environment variables for configuration
     env = os.environ.copy()
     
@@ -228,40 +578,59 @@ def start_server(env_vars=None):
     
     # Start the server with stdout/stderr connected directly to pipes
     server_bin = os.path.join(BIN_DIR, "server")
+    # The server never reads stdin, and its own session keeps a Ctrl+C aimed at us from reaching it
+    # The server keeps its runs in ./data, so a dimension worker's server runs in the worker's directory
     server_proc = subprocess.Popen(
-        [server_bin],
+        [server_bin, str(server_port)],
+        cwd=dimension_worker_dir,
+        stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,  # Line buffered
+        bufsize=0,  # Unbuffered bytes, read in bulk by the monitors
+        close_fds=True,
+        start_new_session=True,
         env=env
     )
+    # Outside our session nothing else stops it if we exit early
+    live_servers.add(server_proc)
     
     # Create log file for saving output
-    log_file_path = os.path.join(RESULTS_DIR, "server_logs.txt")
-    log_file = open(log_file_path, "w")
+    log_file_path = os.path.join(dimension_worker_dir or RESULTS_DIR, "server_logs.txt")
+    log_file = open(log_file_path, "w", buffering=1 << 16)
     
     # Start monitoring stdout and stderr
     def monitor_output(pipe, prefix, log_file):
-        for line in iter(pipe.readline, ''):
+        def handle_line(raw_line):
             timestamp = time.strftime("%H:%M:%S")
-            output = f"[{prefix} {timestamp}] {line.strip()}"
+            output = f"[{prefix} {timestamp}] {raw_line.decode(errors='replace').strip()}"
             print(output)
             log_file.write(output + "\n")
-            log_file.flush()
             
             # Check for bulk load completion
-            if "Bulk load completed successfully" in line:
+            if b"Bulk load completed successfully" in raw_line:
                 print(f"[{prefix} {timestamp}] BULK LOAD DETECTED AS COMPLETED SUCCESSFULLY")
+                log_file.flush()
                 # Signal all active events, as we don't know which specific load this is for
-                with bulk_load_tracker.lock:
-                    for event in bulk_load_tracker.success_events.values():
-                        event.set()
+                bulk_load_tracker.signal_all()
             
             # Check for server started message to know when it's ready
-            if "Server started on port" in line:
+            if b"Server started on port" in raw_line:
                 debug_print(f"Server detected as ready on port")
                 server_ready_event.set()
+        
+        # Read whatever is available in large chunks and split it into lines ourselves
+        fd = pipe.fileno()
+        pending = b""
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            for raw_line in lines:
+                handle_line(raw_line)
+        
+        if pending:
+            handle_line(pending)
     
     # Start monitoring stdout and stderr
     stdout_thread = threading.Thread(
@@ -277,8 +646,31 @@ def start_server(env_vars=None):
         name="monitor_stderr"  # Named thread to find it later
     )
     
+    # Flush the log periodically instead of after every line; closing it flushes the rest
+    def periodic_flush(log_file, interval):
+        while server_proc.poll() is None:
+            time.sleep(interval)
+            try:
+                log_file.flush()
+            except ValueError:
+                return  # Log file was closed
+        # Server exited; the monitors only have its last buffered lines left to write
+        time.sleep(interval)
+        try:
+            log_file.flush()
+        except ValueError:
+            pass
+    
+    flush_thread = threading.Thread(
+        target=periodic_flush,
+        args=(log_file, LOG_FLUSH_INTERVAL),
+        daemon=True,
+        name="flush_server_log"
+    )
+    
     stdout_thread.start()
     stderr_thread.start()
+    flush_thread.start()
     
     # Wait for the server to signal it's ready via the event
     # with a reasonable timeout to prevent hanging
@@ -286,24 +678,25 @@ def start_server(env_vars=None):
     server_start_timeout = time.time() + max_wait_time
     
     debug_print(f"Waiting up to {max_wait_time} seconds for server to be ready...")
-    while not server_ready_event.is_set() and time.time() < server_start_timeout:
+    # Ready once the monitor sees the ready line or the listen port accepts a connection, whichever comes first
+    server_ready = False
+    while time.time() < server_start_timeout:
+        if server_ready_event.wait(timeout=SERVER_PROBE_INTERVAL) or server_accepting_connections():
+            server_ready = True
+            break
         # Check if server is still running
         if server_proc.poll() is not None:
             print(f"Server failed to start. Exit code: {server_proc.returncode}")
             log_file.close()
             sys.exit(1)
-        time.sleep(0.1)
     
-    if not server_ready_event.is_set():
+    if not server_ready:
         print(f"Warning: Server didn't signal ready state after {max_wait_time} seconds")
         print("Proceeding anyway, but connections may fail...")
     else:
         print("Server started successfully")
     
-    # Wait additional time after server reports ready to ensure the socket is actually accepting connections
-    additional_delay = 3  # seconds
-    debug_print(f"Adding {additional_delay}s extra delay to ensure server is fully initialized")
-    time.sleep(additional_delay)
+    # No extra delay needed: the server only reports ready after listen(), so connections queue from then on
     
     # Store the log file in the server process object so we can close it later
     server_proc.log_file = log_file
@@ -322,262 +715,223 @@ def load_data(data_file):
     debug_print(f"Loading data file: {data_file}")
     debug_print(f"File size: {file_size_mb:.2f} MB ({file_size_bytes:,} bytes)")
     
-    # Create a load command file
-    load_file = os.path.join(SCRIPT_DIR, "load_command.txt")
-    with open(load_file, 'w') as f:
-        f.write(f'l "{data_file}"\n')
-        f.write("q\n")
-    
-    debug_print(f"Created command file with load command: l \"{data_file}\"")
+    # The load command is piped straight to the client's stdin, no command file needed
+    load_command = f'l "{data_file}"\nq\n'.encode()
+    debug_print(f"Load command: l \"{data_file}\"")
     
     # Setup event for monitoring completion
     completion_event = bulk_load_tracker.create_event(data_file)
     debug_print(f"Created completion event for {data_file}")
     
     # Run the client with load command - with retries
-    start_time = time.time()
+    start_time = time.perf_counter()
     debug_print(f"Starting client process at {time.strftime('%H:%M:%S')}")
     
     # Add retry mechanism for connection
     max_retries = 10
     retry_delay = 1.0  # seconds
     success = False
+    client_watcher = None
     
     debug_print(f"Using retry mechanism - will attempt up to {max_retries} times with {retry_delay}s between attempts")
     
-    try:
-        for retry in range(max_retries):
-            client_bin = os.path.join(BIN_DIR, "client")
-            debug_print(f"Connection attempt {retry+1}/{max_retries}")
-            
+    for retry in range(max_retries):
+        client_bin = os.path.join(BIN_DIR, "client")
+        debug_print(f"Connection attempt {retry+1}/{max_retries}")
+        
+        # The command fits in the pipe buffer, so it is written and the pipe closed before the client starts;
+        # the client reads it and then sees EOF, just as it did reading a command file
+        command_fd, write_fd = os.pipe()
+        os.write(write_fd, load_command)
+        os.close(write_fd)
+        try:
             client_proc = subprocess.Popen(
-                [client_bin],
-                stdin=open(load_file, 'r'),
+                [client_bin, "127.0.0.1", str(server_port)],
+                stdin=command_fd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
+        finally:
+            os.close(command_fd)
+        
+        debug_print(f"Client process started with PID: {client_proc.pid}")
+        
+        # A helper thread blocks on the client so we wake as soon as it exits. It also sets
+        # the completion event so one wait covers both outcomes; client_exited tells them apart.
+        # The previous attempt's helper must be done first so it can't wake this attempt.
+        if client_watcher is not None:
+            client_watcher.join(timeout=5)
+        completion_event.clear()
+        client_exited = threading.Event()
+        
+        def wait_for_client(proc=client_proc, exited=client_exited):
+            proc.wait()
+            exited.set()
+            completion_event.set()
+        
+        client_watcher = threading.Thread(target=wait_for_client, daemon=True)
+        client_watcher.start()
+        client_output = None
+        
+        # Wait for a short time to see if connection was established
+        client_exited.wait(timeout=0.5)
+        
+        # Check if client has already exited (which would indicate a connection failure)
+        if client_exited.is_set():
+            client_output = client_proc.communicate()
+            stdout, stderr = client_output
+            if "Connection refused" in stderr:
+                debug_print(f"Connection attempt {retry+1} failed: Connection refused")
+                if retry < max_retries - 1:
+                    debug_print(f"Waiting {retry_delay}s before next attempt...")
+                    time.sleep(retry_delay)
+                    # Increase retry delay slightly each time
+                    retry_delay *= 1.2
+                continue
+        
+        # If we reach here, either connection was established or client exited for a different reason
+        debug_print(f"Connection established or client exited for another reason")
+        
+        try:
+            # For larger data sizes, we need a longer timeout
+            # Calculate timeout based on data size (approximately 1 minute per 10MB)
+            file_size_mb = file_size_bytes / (1024 * 1024)
+            timeout_seconds = max(300, int(file_size_mb / 10) * 60)  # Minimum 5 minutes, or 1 minute per 10MB
             
-            debug_print(f"Client process started with PID: {client_proc.pid}")
+            debug_print(f"Waiting for load to complete with timeout of {timeout_seconds} seconds")
             
-            # Wait for a short time to see if connection was established
-            time.sleep(0.5)
+            # Block until either the bulk load is detected in the logs or the client exits
+            elapsed_time_calculated = False
+            completion_event.wait(timeout=timeout_seconds)
+            elapsed = time.perf_counter() - start_time
             
-            # Check if client has already exited (which would indicate a connection failure)
-            if client_proc.poll() is not None:
-                stdout, stderr = client_proc.communicate()
-                if "Connection refused" in stderr:
-                    debug_print(f"Connection attempt {retry+1} failed: Connection refused")
+            if client_exited.is_set():
+                if client_output is None:
+                    client_output = client_proc.communicate()
+                stdout, stderr = client_output
+                debug_print(f"Client exited with code: {client_proc.returncode}")
+                elapsed_time_calculated = True
+                
+                if client_proc.returncode == 0:
+                    success = True
+                elif "Connection refused" in stderr:
+                    # This was a connection failure, try again
+                    debug_print(f"Connection was initially established but later refused")
                     if retry < max_retries - 1:
                         debug_print(f"Waiting {retry_delay}s before next attempt...")
                         time.sleep(retry_delay)
                         # Increase retry delay slightly each time
                         retry_delay *= 1.2
-                    continue
+            elif completion_event.is_set():
+                # Bulk load completed via log detection
+                debug_print(f"Bulk load detected as successful in logs! Elapsed time: {elapsed:.2f} seconds")
+                # Kill the client as we're done
+                client_proc.kill()
+                elapsed_time_calculated = True
+                success = True
+            else:
+                debug_print(f"Timed out after {timeout_seconds} seconds waiting for load to complete")
+                client_proc.kill()
             
-            # If we reach here, either connection was established or client exited for a different reason
-            debug_print(f"Connection established or client exited for another reason")
+            # If client didn't exit, wait for it to finish with a short timeout
+            if client_proc.poll() is None:
+                try:
+                    stdout, stderr = client_proc.communicate(timeout=5)
+                except subprocess.TimeoutExpired:
+                    client_proc.kill()
+                    stdout, stderr = client_proc.communicate()
             
-            try:
-                # For larger data sizes, we need a longer timeout
-                # Calculate timeout based on data size (approximately 1 minute per 10MB)
-                file_size_mb = file_size_bytes / (1024 * 1024)
-                timeout_seconds = max(300, int(file_size_mb / 10) * 60)  # Minimum 5 minutes, or 1 minute per 10MB
-                
-                debug_print(f"Waiting for load to complete with timeout of {timeout_seconds} seconds")
-                
-                # Poll for either client completion or bulk load completion detection
-                elapsed_time_calculated = False
-                wait_start_time = time.time()
-                
-                while True:
-                    # Check if bulk load completed via log detection
-                    if completion_event.is_set():
-                        elapsed = time.time() - start_time
-                        debug_print(f"Bulk load detected as successful in logs! Elapsed time: {elapsed:.2f} seconds")
-                        # Kill the client as we're done
-                        client_proc.kill()
-                        elapsed_time_calculated = True
-                        success = True
-                        break
-                    
-                    # Check if client exited
-                    if client_proc.poll() is not None:
-                        stdout, stderr = client_proc.communicate()
-                        elapsed = time.time() - start_time
-                        debug_print(f"Client exited with code: {client_proc.returncode}")
-                        
-                        if client_proc.returncode == 0:
-                            success = True
-                            elapsed_time_calculated = True
-                            break
-                        else:
-                            # Check error message
-                            if "Connection refused" in stderr:
-                                # This was a connection failure, try again
-                                debug_print(f"Connection was initially established but later refused")
-                                if retry < max_retries - 1:
-                                    debug_print(f"Waiting {retry_delay}s before next attempt...")
-                                    time.sleep(retry_delay)
-                                    # Increase retry delay slightly each time
-                                    retry_delay *= 1.2
-                                elapsed_time_calculated = True
-                                break
-                    
-                    # Check if we've timed out
-                    if time.time() - wait_start_time > timeout_seconds:
-                        elapsed = time.time() - start_time
-                        debug_print(f"Timed out after {timeout_seconds} seconds waiting for load to complete")
-                        client_proc.kill()
-                        elapsed_time_calculated = False
-                        break
-                    
-                    # Wait a bit before checking again
-                    time.sleep(0.5)
-                
-                # If client didn't exit, wait for it to finish with a short timeout
-                if client_proc.poll() is None:
-                    try:
-                        stdout, stderr = client_proc.communicate(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        client_proc.kill()
-                        stdout, stderr = client_proc.communicate()
-                
-                if not elapsed_time_calculated:
-                    elapsed = time.time() - start_time
-                
-                debug_print(f"Load attempt {retry+1} completed in {elapsed:.2f} seconds")
-                
-                if success:
-                    debug_print(f"Data loaded successfully on attempt {retry+1}!")
-                    break
+            if not elapsed_time_calculated:
+                elapsed = time.perf_counter() - start_time
             
-            except Exception as e:
-                debug_print(f"Exception during loading attempt {retry+1}: {str(e)}")
-                client_proc.kill()
-                success = False
-        
-        # Clean up the completion event regardless of outcome
-        bulk_load_tracker.cleanup(data_file)
-        
-        if success:
-            debug_print(f"Data loaded successfully after {retry+1} attempts!")
-            return True
-        else:
-            debug_print(f"All {max_retries} load attempts failed.")
-            return False
+            debug_print(f"Load attempt {retry+1} completed in {elapsed:.2f} seconds")
             
-    finally:
-        if os.path.exists(load_file):
-            os.remove(load_file)
-            debug_print(f"Removed temporary command file: {load_file}")
+            if success:
+                debug_print(f"Data loaded successfully on attempt {retry+1}!")
+                break
+        
+        except Exception as e:
+            debug_print(f"Exception during loading attempt {retry+1}: {str(e)}")
+            client_proc.kill()
+            success = False
+    
+    # Clean up the completion event regardless of outcome
+    bulk_load_tracker.cleanup(data_file)
+    
+    if success:
+        debug_print(f"Data loaded successfully after {retry+1} attempts!")
+        return True
+    else:
+        debug_print(f"All {max_retries} load attempts failed.")
+        return False
 
 def verify_data_loaded():
     """Verify data is loaded by checking stats"""
     debug_print("Verifying data is loaded by checking stats...")
     
-    # Create a stats command file
-    stats_file = os.path.join(SCRIPT_DIR, "stats_command.txt")
-    with open(stats_file, 'w') as f:
-        f.write("s\n")
-        f.write("q\n")
+    # Add retry mechanism for connection
+    max_retries = 5
+    retry_delay = 1.0  # seconds
+    
+    debug_print(f"Using retry mechanism for stats check - will attempt up to {max_retries} times")
     
-    try:
-        # Add retry mechanism for connection
-        max_retries = 5
-        retry_delay = 1.0  # seconds
+    for retry in range(max_retries):
+        debug_print(f"Stats check attempt {retry+1}/{max_retries}")
         
-        debug_print(f"Using retry mechanism for stats check - will attempt up to {max_retries} times")
+        # The control connection reconnects on its own if the previous attempt lost it
+        stdout = control_client.send("s", timeout=10)
         
-        for retry in range(max_retries):
-            debug_print(f"Stats check attempt {retry+1}/{max_retries}")
+        if stdout is not None:
+            # Check if data is loaded by looking for entries and logical pairs
+            stats_lines = [line for line in stdout.split('\n') if "entries" in line.lower() or "logical pairs" in line.lower()]
             
-            try:
-                client_bin = os.path.join(BIN_DIR, "client")
-                client_proc = subprocess.Popen(
-                    [client_bin],
-                    stdin=open(stats_file, 'r'),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Wait briefly to see if connection is established
-                time.sleep(0.5)
-                
-                # Check if client has already exited (which would indicate a connection failure)
-                if client_proc.poll() is not None:
-                    stdout, stderr = client_proc.communicate()
-                    if "Connection refused" in stderr:
-                        debug_print(f"Stats check attempt {retry+1} failed: Connection refused")
-                        if retry < max_retries - 1:
-                            debug_print(f"Waiting {retry_delay}s before next attempt...")
-                            time.sleep(retry_delay)
-                            # Increase retry delay slightly each time
-                            retry_delay *= 1.2
-                        continue
-                
-                # Connection was established or client exited for another reason
-                stdout, stderr = client_proc.communicate(timeout=10)
+            # Look for both mentions of entries and the Logical Pairs count
+            entries_found = any(line for line in stats_lines if "0 entries" not in line)
+            logical_pairs_line = next((line for line in stats_lines if "logical pairs" in line.lower()), None)
+            
+            if entries_found or (logical_pairs_line and "0" not in logical_pairs_line.split(":")[1].strip()):
+                debug_print("Data verified: Found non-zero entries or logical pairs")
+                for line in stats_lines:
+                    debug_print(f"  {line}")
                 
-                if client_proc.returncode == 0:
-                    # Check if data is loaded by looking for entries and logical pairs
-                    stats_lines = [line for line in stdout.split('\n') if "entries" in line.lower() or "logical pairs" in line.lower()]
-                    
-                    # Look for both mentions of entries and the Logical Pairs count
-                    entries_found = any(line for line in stats_lines if "0 entries" not in line)
-                    logical_pairs_line = next((line for line in stats_lines if "logical pairs" in line.lower()), None)
-                    
-                    if entries_found or (logical_pairs_line and "0" not in logical_pairs_line.split(":")[1].strip()):
-                        debug_print("Data verified: Found non-zero entries or logical pairs")
-                        for line in stats_lines:
-                            debug_print(f"  {line}")
-                        
-                        # Additional check for run files in data directory - just informational now
-                        runs_dir = os.path.join(DATA_DIR, "runs")
-                        if os.path.exists(runs_dir):
-                            run_files = os.listdir(runs_dir)
-                            debug_print(f"Found {len(run_files)} run files: {run_files}")
-                        else:
-                            debug_print("No runs directory found - data may still be in buffer only")
-                        
-                        return True
-                    else:
-                        debug_print("No data found in the LSM-tree!")
-                        if retry < max_retries - 1:
-                            debug_print("Will try again to confirm...")
-                            time.sleep(retry_delay)
-                            continue
-                        return False
+                # Additional check for run files in data directory - just informational now
+                runs_dir = os.path.join(DATA_DIR, "runs")
+                if os.path.exists(runs_dir):
+                    run_files = os.listdir(runs_dir)
+                    debug_print(f"Found {len(run_files)} run files: {run_files}")
                 else:
-                    debug_print(f"Stats check failed with exit code: {client_proc.returncode}")
-                    debug_print(f"STDERR: {stderr}")
-                    if retry < max_retries - 1:
-                        debug_print(f"Waiting {retry_delay}s before next attempt...")
-                        time.sleep(retry_delay)
-                        # Increase retry delay slightly each time
-                        retry_delay *= 1.2
-                        continue
-                    return False
-                    
-            except subprocess.TimeoutExpired:
-                debug_print("Stats command timed out")
-                client_proc.kill()
+                    debug_print("No runs directory found - data may still be in buffer only")
+                
+                return True
+            else:
+                debug_print("No data found in the LSM-tree!")
                 if retry < max_retries - 1:
-                    debug_print(f"Waiting {retry_delay}s before next attempt...")
+                    debug_print("Will try again to confirm...")
                     time.sleep(retry_delay)
-                    # Increase retry delay slightly each time
-                    retry_delay *= 1.2
                     continue
                 return False
         
-        # If we reach here, all retries failed
-        debug_print(f"All {max_retries} stats check attempts failed")
-        return False
-        
-    finally:
-        if os.path.exists(stats_file):
-            os.remove(stats_file)
+        debug_print(f"Stats check attempt {retry+1} failed")
+        if retry < max_retries - 1:
+            debug_print(f"Waiting {retry_delay}s before next attempt...")
+            time.sleep(retry_delay)
+            # Increase retry delay slightly each time
+            retry_delay *= 1.2
+    
+    # If we reach here, all retries failed
+    debug_print(f"All {max_retries} stats check attempts failed")
+    return False
+
+def weighted_average(read_value, write_value, read_ops, write_ops):
+    """Average a read and a write metric weighted by how many of each operation ran"""
+    if read_ops > 0 and write_ops > 0:
+        return (read_value * read_ops + write_value * write_ops) / (read_ops + write_ops)
+    if read_ops > 0:
+        return read_value
+    if write_ops > 0:
+        return write_value
+    return None
 
 def extract_metrics(benchmark_output, operation_count, elapsed_time, read_ops=0, write_ops=0):
     """Extract or calculate metrics from benchmark operations"""
@@ -596,68 +950,19 @@ def extract_metrics(benchmark_output, operation_count, elapsed_time, read_ops=0,
         'write_runtime_per_op': None# Runtime per write operation in milliseconds
     }
     
-    # Try to extract metrics directly from stats output first
-    # Average operation times
-    read_time_pattern = r'Reads:\s*([\d.]+)\s*ms/op'
-    write_time_pattern = r'Writes:\s*([\d.]+)\s*ms/op'
-    
-    # Throughput
-    read_throughput_pattern = r'Reads:\s*([\d.]+)\s*ops/sec'
-    write_throughput_pattern = r'Writes:\s*([\d.]+)\s*ops/sec'
+    # Try to extract metrics directly from stats output first, in a single pass.
+    # The first occurrence of each metric wins.
+    for match in STATS_METRICS_PATTERN.finditer(benchmark_output):
+        metric = match.lastgroup
+        if metrics[metric] is None:
+            metrics[metric] = float(match.group(metric))
     
-    # I/O counts
-    read_io_pattern = r'Read I/Os:\s*([\d.]+)'
-    write_io_pattern = r'Write I/Os:\s*([\d.]+)'
-    
-    # Extract metrics from the output
-    read_time_match = re.search(read_time_pattern, benchmark_output)
-    write_time_match = re.search(write_time_pattern, benchmark_output)
-    read_throughput_match = re.search(read_throughput_pattern, benchmark_output)
-    write_throughput_match = re.search(write_throughput_pattern, benchmark_output)
-    read_io_match = re.search(read_io_pattern, benchmark_output)
-    write_io_match = re.search(write_io_pattern, benchmark_output)
-    
-    # Update metrics with direct measurements if available
-    if read_time_match:
-        metrics['read_runtime_per_op'] = float(read_time_match.group(1))
-    
-    if write_time_match:
-        metrics['write_runtime_per_op'] = float(write_time_match.group(1))
-    
-    if read_throughput_match:
-        metrics['read_throughput'] = float(read_throughput_match.group(1))
-    
-    if write_throughput_match:
-        metrics['write_throughput'] = float(write_throughput_match.group(1))
-    
-    if read_io_match:
-        metrics['read_ios'] = float(read_io_match.group(1))
-    
-    if write_io_match:
-        metrics['write_ios'] = float(write_io_match.group(1))
-    
-    # Calculate overall metrics based on the measured read/write metrics
+    # Calculate overall latency and throughput as op-weighted averages of the measured read/write values
     if metrics['read_runtime_per_op'] is not None and metrics['write_runtime_per_op'] is not None:
-        # If we have both read and write times, calculate weighted average
-        if read_ops > 0 and write_ops > 0:
-            metrics['runtime_per_op'] = ((metrics['read_runtime_per_op'] * read_ops) + 
-                                        (metrics['write_runtime_per_op'] * write_ops)) / operation_count
-        elif read_ops > 0:
-            metrics['runtime_per_op'] = metrics['read_runtime_per_op']
-        elif write_ops > 0:
-            metrics['runtime_per_op'] = metrics['write_runtime_per_op']
-    
-    # Calculate overall throughput based on the measured read/write throughputs
+        metrics['runtime_per_op'] = weighted_average(metrics['read_runtime_per_op'], metrics['write_runtime_per_op'], read_ops, write_ops)
+    
     if metrics['read_throughput'] is not None and metrics['write_throughput'] is not None:
-        # If we have both read and write throughputs, calculate weighted average
-        if read_ops > 0 and write_ops > 0:
-            read_weight = read_ops / operation_count
-            write_weight = write_ops / operation_count
-            metrics['throughput'] = (metrics['read_throughput'] * read_weight) + (metrics['write_throughput'] * write_weight)
-        elif read_ops > 0:
-            metrics['throughput'] = metrics['read_throughput']
-        elif write_ops > 0:
-            metrics['throughput'] = metrics['write_throughput']
+        metrics['throughput'] = weighted_average(metrics['read_throughput'], metrics['write_throughput'], read_ops, write_ops)
     
     # Fall back to end-to-end measurements if we couldn't extract direct metrics
     if metrics['throughput'] is None and operation_count > 0 and elapsed_time > 0:
@@ -734,236 +1039,124 @@ def run_benchmark_test(operation="mixed", query_distribution="uniform", read_wri
     
     print(f"  Operations breakdown: {read_ops} reads, {write_ops} writes")
     
-    # Create a benchmark command file with operations
-    bench_file = os.path.join(SCRIPT_DIR, "bench_command.txt")
-    try:
-        with open(bench_file, 'w') as f:
-            # First, reset the stats to get clean metrics
-            f.write("r\n")  # 'r' for reset stats
-            
-            operations_executed = 0
-            read_operations_executed = 0
-            write_operations_executed = 0
-            
-            # First, generate all the read operations
-            for i in range(read_ops):
-                # Generate reads
-                if query_distribution == "uniform":
-                    # Uniform distribution of queries
-                    key = random.randint(0, 2**63 - 1)
-                elif query_distribution == "skewed":
-                    # Skewed distribution - 80% of queries target 20% of key space
-                    if random.random() < 0.8:
-                        key = random.randint(0, int(0.2 * (2**63 - 1)))
-                    else:
-                        key = random.randint(int(0.2 * (2**63 - 1)), 2**63 - 1)
-                
-                f.write(f"g {key}\n")
-                operations_executed += 1
-                read_operations_executed += 1
-            
-            # Then, generate all the write operations
-            for i in range(write_ops):
-                # Generate writes
-                if query_distribution == "uniform":
-                    # Uniform distribution of queries
-                    key = random.randint(0, 2**63 - 1)
-                elif query_distribution == "skewed":
-                    # Skewed distribution - 80% of queries target 20% of key space
-                    if random.random() < 0.8:
-                        key = random.randint(0, int(0.2 * (2**63 - 1)))
-                    else:
-                        key = random.randint(int(0.2 * (2**63 - 1)), 2**63 - 1)
-                
-                value = random.randint(0, 2**63 - 1)
-                f.write(f"p {key} {value}\n")
-                operations_executed += 1
-                write_operations_executed += 1
-            
-            # Add stats command to get I/O info
-            f.write("s\n")
-            # Add quit command at the end
-            f.write("q\n")
-        
-        # Function to run a client
-        def run_client(client_id, result_queue):
-            client_start_time = time.time()
-            
-            client_bin = os.path.join(BIN_DIR, "client")
-            client_proc = subprocess.Popen(
-                [client_bin],
-                stdin=open(bench_file, 'r'),
+    # Build the benchmark commands in memory; every client gets the same bytes on stdin
+    rng = np.random.default_rng()
+    
+    # First, generate all the read operations, then all the write operations
+    read_keys = generate_keys(read_ops, query_distribution, rng).tolist()
+    write_keys = generate_keys(write_ops, query_distribution, rng).tolist()
+    write_values = rng.integers(0, MAX_KEY, size=write_ops, dtype=np.uint64, endpoint=True).tolist()
+    
+    # Format each block of commands in one C-level pass
+    reads = "".join(map("g {}\n".format, read_keys))
+    writes = "".join(map("p {} {}\n".format, write_keys, write_values))
+    
+    read_operations_executed = len(read_keys)
+    write_operations_executed = len(write_keys)
+    operations_executed = read_operations_executed + write_operations_executed
+    
+    # 'r' resets stats to get clean metrics; 's' gets I/O info at the end, then quit
+    bench_input = f"r\n{reads}{writes}s\nq\n".encode()
+    
+    # Add retry mechanism for connection
+    max_retries = 5
+    
+    # Coroutine running one client; all clients run as subprocesses of a single event loop
+    async def run_client(client_id):
+        client_bin = os.path.join(BIN_DIR, "client")
+        retry_delay = 1.0  # seconds
+        
+        for retry in range(max_retries):
+            client_start_time = time.perf_counter()
+            client_proc = await asyncio.create_subprocess_exec(
+                client_bin, "127.0.0.1", str(server_port),
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.PIPE
             )
             
             try:
                 # Increased timeout for larger datasets - 5 minutes per client
-                stdout, stderr = client_proc.communicate(timeout=300)
-                
-                client_elapsed = time.time() - client_start_time
-                print(f"Client {client_id} completed in {client_elapsed:.2f} seconds")
-                
-                success = client_proc.returncode == 0
-                result_queue.put((client_id, success, stdout, stderr, client_elapsed, read_operations_executed, write_operations_executed))
-            except subprocess.TimeoutExpired:
+                stdout, stderr = await asyncio.wait_for(client_proc.communicate(bench_input), timeout=300)
+            except asyncio.TimeoutError:
                 print(f"Client {client_id} timed out after 5 minutes")
                 client_proc.kill()
-                result_queue.put((client_id, False, "", "Timeout", 300, 0, 0))
-        
-        # Run multiple clients in parallel
-        start_time = time.time()
-        
-        if client_count == 1:
-            # Single client is simple
-            client_bin = os.path.join(BIN_DIR, "client")
+                await client_proc.wait()
+                return (client_id, False, "", "Timeout", 300, 0, 0)
             
-            # Add retry mechanism for connection
-            max_retries = 5
-            retry_delay = 1.0  # seconds
-            success = False
+            stdout = stdout.decode(errors='replace')
+            stderr = stderr.decode(errors='replace')
             
-            debug_print(f"Using retry mechanism for benchmark - will attempt up to {max_retries} times")
+            # A refused connection never ran any commands, so it is safe to try again
+            if client_proc.returncode != 0 and "Connection refused" in stderr and retry < max_retries - 1:
+                debug_print(f"Client {client_id} attempt {retry+1} failed: Connection refused")
+                debug_print(f"Waiting {retry_delay}s before next attempt...")
+                await asyncio.sleep(retry_delay)
+                # Increase retry delay slightly each time
+                retry_delay *= 1.2
+                continue
             
-            for retry in range(max_retries):
-                debug_print(f"Benchmark attempt {retry+1}/{max_retries}")
-                
-                client_proc = subprocess.Popen(
-                    [client_bin],
-                    stdin=open(bench_file, 'r'),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Wait briefly to see if connection is established
-                time.sleep(0.5)
-                
-                # Check if client has already exited (which would indicate a connection failure)
-                if client_proc.poll() is not None:
-                    stdout, stderr = client_proc.communicate()
-                    if "Connection refused" in stderr:
-                        debug_print(f"Benchmark attempt {retry+1} failed: Connection refused")
-                        if retry < max_retries - 1:
-                            debug_print(f"Waiting {retry_delay}s before next attempt...")
-                            time.sleep(retry_delay)
-                            # Increase retry delay slightly each time
-                            retry_delay *= 1.2
-                        continue
-                
-                try:
-                    # Increased timeout for larger datasets - 5 minutes
-                    stdout, stderr = client_proc.communicate(timeout=300)
-                    
-                    elapsed = time.time() - start_time
-                    print(f"Benchmark completed in {elapsed:.2f} seconds")
-                    
-                    if client_proc.returncode == 0:
-                        success = True
-                        # Extract metrics - pass the actual executed operations
-                        metrics = extract_metrics(stdout, operations_executed, elapsed, read_operations_executed, write_operations_executed)
-                        
-                        print("\nExtracted Metrics:")
-                        for metric, value in metrics.items():
-                            if value is not None:
-                                print(f"  {metric}: {value}")
-                                
-                            # Save full output for debugging
-                            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                            output_file = os.path.join(RESULTS_DIR, f"benchmark_{operation}_{timestamp}.txt")
-                            with open(output_file, 'w') as f:
-                                f.write(stdout)
-                        
-                        return True, metrics
-                    else:
-                        print(f"Benchmark failed with exit code: {client_proc.returncode}")
-                        print(f"STDERR: {stderr}")
-                        if retry < max_retries - 1:
-                            debug_print(f"Retrying benchmark...")
-                            continue
-                        return False, None
-                        
-                except subprocess.TimeoutExpired:
-                    print(f"Benchmark timed out after 5 minutes")
-                    client_proc.kill()
-                    if retry < max_retries - 1:
-                        debug_print(f"Retrying benchmark after timeout...")
-                        continue
-                    return False, None
+            client_elapsed = time.perf_counter() - client_start_time
+            print(f"Client {client_id} completed in {client_elapsed:.2f} seconds")
             
-            # If we reach here, all retries failed
-            print(f"All {max_retries} benchmark attempts failed")
-            return False, None
+            success = client_proc.returncode == 0
+            return (client_id, success, stdout, stderr, client_elapsed, read_operations_executed, write_operations_executed)
+    
+    async def run_clients():
+        return await asyncio.gather(*(run_client(i) for i in range(client_count)))
+    
+    if client_count >= SERVER_MAX_CLIENTS:
+        # Free the control client's connection slot; it reconnects on its next command
+        control_client.close()
+    
+    # Run all clients in parallel
+    start_time = time.perf_counter()
+    results = asyncio.run(run_clients())
+    
+    # Get results
+    elapsed = time.perf_counter() - start_time
+    print(f"All clients completed in {elapsed:.2f} seconds")
+    
+    # Collect results
+    success_count = 0
+    total_ops = 0
+    total_read_ops = 0
+    total_write_ops = 0
+    output_parts = []
+    
+    for client_id, success, stdout, stderr, client_elapsed, read_ops_exec, write_ops_exec in results:
+        if success:
+            success_count += 1
+            output_parts += [f"--- CLIENT {client_id} OUTPUT ---\n", stdout, "\n\n"]
+            total_ops += operations_executed
+            total_read_ops += read_ops_exec
+            total_write_ops += write_ops_exec
         else:
-            # Run multiple clients in parallel
-            import queue
-            result_queue = queue.Queue()
-            threads = []
-            
-            for i in range(client_count):
-                thread = threading.Thread(
-                    target=run_client, 
-                    args=(i, result_queue)
-                )
-                threads.append(thread)
-                thread.start()
-            
-            # Wait for all clients to finish
-            for thread in threads:
-                thread.join()
-            
-            # Get results
-            elapsed = time.time() - start_time
-            print(f"All clients completed in {elapsed:.2f} seconds")
-            
-            # Collect results
-            success_count = 0
-            total_ops = 0
-            total_read_ops = 0
-            total_write_ops = 0
-            combined_output = ""
-            
-            while not result_queue.empty():
-                client_id, success, stdout, stderr, client_elapsed, read_ops_exec, write_ops_exec = result_queue.get()
-                if success:
-                    success_count += 1
-                    combined_output += f"--- CLIENT {client_id} OUTPUT ---\n{stdout}\n\n"
-                    total_ops += operations_executed
-                    total_read_ops += read_ops_exec
-                    total_write_ops += write_ops_exec
-                else:
-                    print(f"Client {client_id} failed: {stderr}")
-            
-            if success_count > 0:
-                # Extract metrics from combined output
-                metrics = extract_metrics(combined_output, total_ops, elapsed, total_read_ops, total_write_ops)
-                
-                print("\nExtracted Metrics:")
-                for metric, value in metrics.items():
-                    if value is not None:
-                        print(f"  {metric}: {value}")
-                
-                # Save combined output
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = os.path.join(RESULTS_DIR, f"benchmark_{operation}_{client_count}clients_{timestamp}.txt")
-                with open(output_file, 'w') as f:
-                    f.write(combined_output)
-                
-                return success_count == client_count, metrics
-            else:
-                print(f"All clients failed")
-                return False, None
+            print(f"Client {client_id} failed: {stderr}")
     
-    finally:
-        # Clean up the command file
-        if os.path.exists(bench_file):
-            os.remove(bench_file)
+    combined_output = "".join(output_parts)
+    
+    if success_count > 0:
+        # Extract metrics from combined output
+        metrics = extract_metrics(combined_output, total_ops, elapsed, total_read_ops, total_write_ops)
+        
+        print("\nExtracted Metrics:")
+        for metric, value in metrics.items():
+            if value is not None:
+                print(f"  {metric}: {value}")
+        
+        # Save combined output
+        timestamp = output_timestamp()
+        output_file = os.path.join(dimension_worker_dir or RESULTS_DIR, f"benchmark_{operation}_{client_count}clients_{timestamp}.txt")
+        write_file_bytes(output_file, combined_output.encode(errors='replace'))
+        
+        return success_count == client_count, metrics
+    else:
+        print(f"All clients failed")
+        return False, None
 
 def save_metrics_to_csv(dimension, values, metrics_dict, operation, plot_dir):
     """Save metrics for a dimension to a CSV file"""
-    os.makedirs(plot_dir, exist_ok=True)
-    
     print(f"DEBUG: Saving metrics to CSV for dimension {dimension} with {len(metrics_dict)} entries")
     print(f"DEBUG: Values for {dimension}: {values}")
     print(f"DEBUG: Metrics keys: {list(metrics_dict.keys())}")
@@ -980,16 +1173,13 @@ def save_metrics_to_csv(dimension, values, metrics_dict, operation, plot_dir):
         'read_runtime_per_op', 'write_runtime_per_op'
     ]
     
-    with open(csv_file, 'w', newline='') as f:
+    # One row per value that has metrics, in the dimension's value order
+    rows = [{'value': value, **metrics_dict[value]} for value in values if value in metrics_dict]
+    
+    with open(csv_file, 'w', newline='', buffering=1 << 16) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        
-        # Write each value's metrics
-        for value in values:
-            if value in metrics_dict:
-                row = {'value': value}
-                row.update(metrics_dict[value])
-                writer.writerow(row)
+        writer.writerows(rows)
     
     print(f"Metrics saved to CSV: {csv_file}")
     return csv_file
@@ -1000,8 +1190,6 @@ def generate_plots(dimension, values, metrics_dict, operation, plot_dir, config)
     print(f"DEBUG: Plot directory: {plot_dir}")
     print(f"DEBUG: Number of values with metrics: {len([v for v in values if v in metrics_dict])}")
     
-    os.makedirs(plot_dir, exist_ok=True)
-    
     # Only plot values that have metrics
     plot_values = [v for v in values if v in metrics_dict]
     
@@ -1011,6 +1199,22 @@ def generate_plots(dimension, values, metrics_dict, operation, plot_dir, config)
     
     print(f"DEBUG: Plot values: {plot_values}")
     
+    # Gather every plotted metric once into one column per metric; missing metrics become NaN
+    metrics = np.array(
+        [tuple(np.nan if metrics_dict[v].get(m) is None else metrics_dict[v][m] for m in PLOT_METRICS)
+         for v in plot_values],
+        dtype=[(m, 'f8') for m in PLOT_METRICS]
+    )
+    
+    # matplotlib is only imported once there is something to plot, since it is slow to load
+    import matplotlib
+    matplotlib.use('Agg')  # Plots are only ever saved to files, so skip the GUI backend probing
+    import matplotlib.pyplot as plt
+    plt.ioff()
+    
+    # One figure is reused for every chart; clearing the axes is much cheaper than a new figure
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
     try:
         # Get display values (scaled) and labels
         scale_factor = config["scale_factor"]
@@ -1040,53 +1244,58 @@ def generate_plots(dimension, values, metrics_dict, operation, plot_dir, config)
         
         dimension_name = config["name"]
         
+        # Positions of the bars in the bar charts, offset per series in one vectorized step
+        x_pos = np.arange(len(x_values))
+        
+        # Labels and file names shared by every chart
+        xlabel = f'{dimension_name} ({units})' if units else dimension_name
+        title_suffix = f'{dimension_name} ({operation.upper()} operations)'
+        plot_paths = {
+            name: os.path.join(plot_dir, f"{dimension}_{operation}_{name}.png")
+            for name in ("io", "throughput", "runtime_per_op", "runtime_per_op_linear", "total_runtime", "cache_misses")
+        }
+        
         print(f"DEBUG: Creating I/O operations plot")
         
         # Create read and write I/O operations plot
-        plt.figure(figsize=(10, 6))
-        read_ios = [metrics_dict[v].get('read_ios', 0) for v in plot_values]
-        write_ios = [metrics_dict[v].get('write_ios', 0) for v in plot_values]
+        ax.clear()
+        read_ios = metrics['read_ios']
+        write_ios = metrics['write_ios']
         
         # Use bar charts for data_distribution and query_distribution
         if dimension in ["data_distribution", "query_distribution"]:
             bar_width = 0.35
-            x_pos = range(len(x_values))
             
-            plt.bar([p - bar_width/2 for p in x_pos], read_ios, bar_width, label='Read I/Os')
-            plt.bar([p + bar_width/2 for p in x_pos], write_ios, bar_width, label='Write I/Os')
-            plt.xticks(x_pos, x_labels)
+            ax.bar(x_pos - bar_width/2, read_ios, bar_width, label='Read I/Os')
+            ax.bar(x_pos + bar_width/2, write_ios, bar_width, label='Write I/Os')
+            ax.set_xticks(x_pos, x_labels)
         else:
-            plt.plot(x_values, read_ios, 'o-', linewidth=2, markersize=8, label='Read I/Os')
-            plt.plot(x_values, write_ios, 's-', linewidth=2, markersize=8, label='Write I/Os')
-            plt.xticks(x_values, x_labels)
+            ax.plot(x_values, read_ios, 'o-', linewidth=2, markersize=8, label='Read I/Os')
+            ax.plot(x_values, write_ios, 's-', linewidth=2, markersize=8, label='Write I/Os')
+            ax.set_xticks(x_values, x_labels)
             
             # Use logarithmic x-axis for buffer_size
             if dimension == "buffer_size":
-                plt.xscale('log')
-                plt.grid(True, which="both", ls="-")
+                ax.set_xscale('log')
+                ax.grid(True, which="both", ls="-")
         
-        plt.title(f'I/O Operations vs. {dimension_name} ({operation.upper()} operations)')
-        plt.xlabel(f'{dimension_name} ({units})' if units else dimension_name)
-        plt.ylabel('I/O Operations')
-        plt.grid(True)
-        plt.legend()
+        ax.set_title(f'I/O Operations vs. {title_suffix}')
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('I/O Operations')
+        ax.grid(True)
+        ax.legend()
         
-        io_plot = os.path.join(plot_dir, f"{dimension}_{operation}_io.png")
-        plt.savefig(io_plot)
-        plt.close()
+        io_plot = plot_paths["io"]
+        fig.savefig(io_plot, **PNG_SAVE_KWARGS)
         
         print(f"DEBUG: Saved I/O plot to {io_plot}")
         print(f"DEBUG: Creating throughput plot")
         
         # Create throughput plot with separate read/write lines
-        plt.figure(figsize=(10, 6))
-        total_throughputs = [metrics_dict[v].get('throughput', 0) for v in plot_values]
-        read_throughputs = [metrics_dict[v].get('read_throughput', 0) for v in plot_values]
-        write_throughputs = [metrics_dict[v].get('write_throughput', 0) for v in plot_values]
-        
-        # Make sure read_throughputs has valid values (not None)
-        read_throughputs = [0 if t is None else t for t in read_throughputs]
-        write_throughputs = [0 if t is None else t for t in write_throughputs]
+        ax.clear()
+        total_throughputs = metrics['throughput']
+        read_throughputs = metrics['read_throughput']
+        write_throughputs = metrics['write_throughput']
         
         # Debugging the throughput values to check what's being plotted
         print(f"Debug - Read throughputs: {read_throughputs}")
@@ -1096,188 +1305,273 @@ def generate_plots(dimension, values, metrics_dict, operation, plot_dir, config)
         # Use bar charts for data_distribution and query_distribution
         if dimension in ["data_distribution", "query_distribution"]:
             bar_width = 0.3
-            x_pos = range(len(x_values))
             
-            plt.bar([p - bar_width for p in x_pos], read_throughputs, bar_width, label='Read Throughput')
-            plt.bar([p for p in x_pos], total_throughputs, bar_width, label='Total Throughput')
-            plt.bar([p + bar_width for p in x_pos], write_throughputs, bar_width, label='Write Throughput')
-            plt.xticks(x_pos, x_labels)
+            ax.bar(x_pos - bar_width, read_throughputs, bar_width, label='Read Throughput')
+            ax.bar(x_pos, total_throughputs, bar_width, label='Total Throughput')
+            ax.bar(x_pos + bar_width, write_throughputs, bar_width, label='Write Throughput')
+            ax.set_xticks(x_pos, x_labels)
         else:
-            plt.plot(x_values, read_throughputs, 'o-', linewidth=2, markersize=8, label='Read Throughput', color='blue')
-            plt.plot(x_values, total_throughputs, '*-', linewidth=2, markersize=8, label='Total Throughput', color='green')
-            plt.plot(x_values, write_throughputs, 's-', linewidth=2, markersize=8, label='Write Throughput', color='red')
-            plt.xticks(x_values, x_labels)
+            ax.plot(x_values, read_throughputs, 'o-', linewidth=2, markersize=8, label='Read Throughput', color='blue')
+            ax.plot(x_values, total_throughputs, '*-', linewidth=2, markersize=8, label='Total Throughput', color='green')
+            ax.plot(x_values, write_throughputs, 's-', linewidth=2, markersize=8, label='Write Throughput', color='red')
+            ax.set_xticks(x_values, x_labels)
             
             # Use logarithmic x-axis for buffer_size
             if dimension == "buffer_size":
-                plt.xscale('log')
-                plt.grid(True, which="both", ls="-")
+                ax.set_xscale('log')
+                ax.grid(True, which="both", ls="-")
         
-        plt.title(f'Throughput vs. {dimension_name} ({operation.upper()} operations)')
-        plt.xlabel(f'{dimension_name} ({units})' if units else dimension_name)
-        plt.ylabel('Throughput (ops/sec)')
-        plt.grid(True)
-        plt.legend()
+        ax.set_title(f'Throughput vs. {title_suffix}')
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Throughput (ops/sec)')
+        ax.grid(True)
+        ax.legend()
         
-        throughput_plot = os.path.join(plot_dir, f"{dimension}_{operation}_throughput.png")
-        plt.savefig(throughput_plot)
-        plt.close()
+        throughput_plot = plot_paths["throughput"]
+        fig.savefig(throughput_plot, **PNG_SAVE_KWARGS)
         
         print(f"DEBUG: Saved throughput plot to {throughput_plot}")
         print(f"DEBUG: Creating runtime per operation plot")
         
         # Create runtime per operation plot with separate read/write lines
-        plt.figure(figsize=(10, 6))
-        total_runtime_per_op = [metrics_dict[v].get('runtime_per_op', 0) for v in plot_values]
-        read_runtime_per_op = [metrics_dict[v].get('read_runtime_per_op', 0) for v in plot_values]
-        write_runtime_per_op = [metrics_dict[v].get('write_runtime_per_op', 0) for v in plot_values]
-        
-        # Make sure runtime values are valid (not None)
-        read_runtime_per_op = [0 if t is None else t for t in read_runtime_per_op]
-        write_runtime_per_op = [0 if t is None else t for t in write_runtime_per_op]
+        ax.clear()
+        total_runtime_per_op = metrics['runtime_per_op']
+        read_runtime_per_op = metrics['read_runtime_per_op']
+        write_runtime_per_op = metrics['write_runtime_per_op']
         
         # Debugging the runtime values to check what's being plotted
         print(f"Debug - Read runtime per op: {read_runtime_per_op}")
         print(f"Debug - Write runtime per op: {write_runtime_per_op}")
         print(f"Debug - Total runtime per op: {total_runtime_per_op}")
         
+        # Only draw the scale that suits the spread of the values: log once they span an order of magnitude
+        runtime_values = np.concatenate([read_runtime_per_op, total_runtime_per_op, write_runtime_per_op])
+        runtime_values = runtime_values[runtime_values > 0]
+        use_log_scale = runtime_values.size > 0 and runtime_values.max() / runtime_values.min() >= RUNTIME_LOG_SCALE_SPAN
+        
         # Use bar charts for data_distribution and query_distribution
         if dimension in ["data_distribution", "query_distribution"]:
             bar_width = 0.3
-            x_pos = range(len(x_values))
             
-            plt.bar([p - bar_width for p in x_pos], read_runtime_per_op, bar_width, label='Read Runtime')
-            plt.bar([p for p in x_pos], total_runtime_per_op, bar_width, label='Total Runtime')
-            plt.bar([p + bar_width for p in x_pos], write_runtime_per_op, bar_width, label='Write Runtime')
-            plt.xticks(x_pos, x_labels)
+            ax.bar(x_pos - bar_width, read_runtime_per_op, bar_width, label='Read Runtime')
+            ax.bar(x_pos, total_runtime_per_op, bar_width, label='Total Runtime')
+            ax.bar(x_pos + bar_width, write_runtime_per_op, bar_width, label='Write Runtime')
+            ax.set_xticks(x_pos, x_labels)
         else:
-            plt.plot(x_values, read_runtime_per_op, 'o-', linewidth=2, markersize=8, label='Read Runtime per Op', color='blue')
-            plt.plot(x_values, total_runtime_per_op, '*-', linewidth=2, markersize=8, label='Overall Runtime per Op', color='green')
-            plt.plot(x_values, write_runtime_per_op, 's-', linewidth=2, markersize=8, label='Write Runtime per Op', color='red')
-            plt.xticks(x_values, x_labels)
+            ax.plot(x_values, read_runtime_per_op, 'o-', linewidth=2, markersize=8, label='Read Runtime per Op', color='blue')
+            ax.plot(x_values, total_runtime_per_op, '*-', linewidth=2, markersize=8, label='Overall Runtime per Op', color='green')
+            ax.plot(x_values, write_runtime_per_op, 's-', linewidth=2, markersize=8, label='Write Runtime per Op', color='red')
+            ax.set_xticks(x_values, x_labels)
             
             # Use logarithmic x-axis for buffer_size
             if dimension == "buffer_size":
-                plt.xscale('log')
-        
-        # Use logarithmic scale for y-axis to better visualize wide range of values
-        plt.yscale('log')
-        
-        plt.title(f'Runtime per Operation vs. {dimension_name} ({operation.upper()} operations)')
-        plt.xlabel(f'{dimension_name} ({units})' if units else dimension_name)
-        plt.ylabel('Runtime (ms/op) - Log Scale')
-        plt.grid(True, which="both", ls="-")
-        plt.legend()
-        
-        runtime_plot = os.path.join(plot_dir, f"{dimension}_{operation}_runtime_per_op.png")
-        plt.savefig(runtime_plot)
-        plt.close()
-        
-        print(f"DEBUG: Saved runtime per operation plot to {runtime_plot}")
-        print(f"DEBUG: Creating a second runtime plot with linear scale for reference")
-        
-        # Create a second runtime plot with linear scale for reference
-        plt.figure(figsize=(10, 6))
-        if dimension in ["data_distribution", "query_distribution"]:
-            bar_width = 0.3
-            x_pos = range(len(x_values))
-            
-            plt.bar([p - bar_width for p in x_pos], read_runtime_per_op, bar_width, label='Read Runtime')
-            plt.bar([p for p in x_pos], total_runtime_per_op, bar_width, label='Total Runtime')
-            plt.bar([p + bar_width for p in x_pos], write_runtime_per_op, bar_width, label='Write Runtime')
-            plt.xticks(x_pos, x_labels)
+                ax.set_xscale('log')
+        
+        ax.set_title(f'Runtime per Operation vs. {title_suffix}')
+        ax.set_xlabel(xlabel)
+        if use_log_scale:
+            ax.set_yscale('log')
+            ax.set_ylabel('Runtime (ms/op) - Log Scale')
+            ax.grid(True, which="both", ls="-")
+            runtime_plot, stale_plot = plot_paths["runtime_per_op"], plot_paths["runtime_per_op_linear"]
         else:
-            plt.plot(x_values, read_runtime_per_op, 'o-', linewidth=2, markersize=8, label='Read Runtime per Op', color='blue')
-            plt.plot(x_values, total_runtime_per_op, '*-', linewidth=2, markersize=8, label='Overall Runtime per Op', color='green')
-            plt.plot(x_values, write_runtime_per_op, 's-', linewidth=2, markersize=8, label='Write Runtime per Op', color='red')
-            plt.xticks(x_values, x_labels)
-            
-            # Use logarithmic x-axis for buffer_size
-            if dimension == "buffer_size":
-                plt.xscale('log')
+            ax.set_ylabel('Runtime (ms/op) - Linear Scale')
+            ax.grid(True)
+            runtime_plot, stale_plot = plot_paths["runtime_per_op_linear"], plot_paths["runtime_per_op"]
+        ax.legend()
         
-        plt.title(f'Runtime per Operation vs. {dimension_name} ({operation.upper()} operations)')
-        plt.xlabel(f'{dimension_name} ({units})' if units else dimension_name)
-        plt.ylabel('Runtime (ms/op) - Linear Scale')
-        plt.grid(True)
-        plt.legend()
+        fig.savefig(runtime_plot, **PNG_SAVE_KWARGS)
         
-        linear_runtime_plot = os.path.join(plot_dir, f"{dimension}_{operation}_runtime_per_op_linear.png")
-        plt.savefig(linear_runtime_plot)
-        plt.close()
+        # Drop the other scale's chart from an earlier run so the directory matches the returned paths
+        if os.path.exists(stale_plot):
+            os.remove(stale_plot)
         
-        print(f"DEBUG: Saved linear runtime per operation plot to {linear_runtime_plot}")
+        print(f"DEBUG: Saved runtime per operation plot to {runtime_plot}")
         print(f"DEBUG: Keeping total runtime plot for reference")
         
         # Keep the total runtime plot for reference
-        plt.figure(figsize=(10, 6))
-        runtimes = [metrics_dict[v].get('runtime', 0) for v in plot_values]
+        ax.clear()
+        runtimes = metrics['runtime']
         
         # Use bar charts for data_distribution and query_distribution
         if dimension in ["data_distribution", "query_distribution"]:
-            plt.bar(x_values, runtimes)
-            plt.xticks(range(len(x_values)), x_labels)
+            ax.bar(x_values, runtimes)
+            ax.set_xticks(x_pos, x_labels)
         else:
-            plt.plot(x_values, runtimes, 'o-', linewidth=2, markersize=8)
-            plt.xticks(x_values, x_labels)
+            ax.plot(x_values, runtimes, 'o-', linewidth=2, markersize=8)
+            ax.set_xticks(x_values, x_labels)
             
             # Use logarithmic x-axis for buffer_size
             if dimension == "buffer_size":
-                plt.xscale('log')
+                ax.set_xscale('log')
         
-        plt.title(f'Total Runtime vs. {dimension_name} ({operation.upper()} operations)')
-        plt.xlabel(f'{dimension_name} ({units})' if units else dimension_name)
-        plt.ylabel('Total Runtime (seconds)')
-        plt.grid(True)
+        ax.set_title(f'Total Runtime vs. {title_suffix}')
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Total Runtime (seconds)')
+        ax.grid(True)
         
-        total_runtime_plot = os.path.join(plot_dir, f"{dimension}_{operation}_total_runtime.png")
-        plt.savefig(total_runtime_plot)
-        plt.close()
+        total_runtime_plot = plot_paths["total_runtime"]
+        fig.savefig(total_runtime_plot, **PNG_SAVE_KWARGS)
         
         print(f"DEBUG: Saved total runtime plot to {total_runtime_plot}")
         print(f"DEBUG: Creating cache misses plot")
         
         # Create cache misses plot
-        plt.figure(figsize=(10, 6))
-        cache_misses = [metrics_dict[v].get('cache_misses', 0) for v in plot_values]
+        ax.clear()
+        cache_misses = metrics['cache_misses']
         
         # Use bar charts for data_distribution and query_distribution
         if dimension in ["data_distribution", "query_distribution"]:
-            plt.bar(x_values, cache_misses)
-            plt.xticks(range(len(x_values)), x_labels)
+            ax.bar(x_values, cache_misses)
+            ax.set_xticks(x_pos, x_labels)
         else:
-            plt.plot(x_values, cache_misses, 'o-', linewidth=2, markersize=8)
-            plt.xticks(x_values, x_labels)
+            ax.plot(x_values, cache_misses, 'o-', linewidth=2, markersize=8)
+            ax.set_xticks(x_values, x_labels)
             
             # Use logarithmic x-axis for buffer_size
             if dimension == "buffer_size":
-                plt.xscale('log')
+                ax.set_xscale('log')
         
-        plt.title(f'Cache Misses vs. {dimension_name} ({operation.upper()} operations)')
-        plt.xlabel(f'{dimension_name} ({units})' if units else dimension_name)
-        plt.ylabel('Cache Misses')
-        plt.grid(True)
+        ax.set_title(f'Cache Misses vs. {title_suffix}')
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Cache Misses')
+        ax.grid(True)
         
-        cache_plot = os.path.join(plot_dir, f"{dimension}_{operation}_cache_misses.png")
-        plt.savefig(cache_plot)
-        plt.close()
+        cache_plot = plot_paths["cache_misses"]
+        fig.savefig(cache_plot, **PNG_SAVE_KWARGS)
         
         print(f"DEBUG: Saved cache misses plot to {cache_plot}")
         print(f"DEBUG: All plots generated successfully for {dimension}")
         
-        return [io_plot, throughput_plot, runtime_plot, linear_runtime_plot, total_runtime_plot, cache_plot]
+        return [io_plot, throughput_plot, runtime_plot, total_runtime_plot, cache_plot]
         
     except Exception as e:
         print(f"ERROR: Exception during plot generation: {str(e)}")
         import traceback
         traceback.print_exc()
         return []
+    finally:
+        plt.close(fig)
 
-def test_dimension(dimension, operation="get", auto_continue=True):
+def dimension_test_setup(dimension, value, operation):
+    """Work out the data file, server env vars and benchmark arguments for one dimension value"""
+    setup = {
+        "data_size": BASELINE["data_size"],
+        "data_distribution": BASELINE["data_distribution"],
+        "env_vars": None,
+        "benchmark": {
+            "operation": operation,
+            "query_distribution": BASELINE["query_distribution"],
+            "read_write_ratio": BASELINE["read_write_ratio"],
+            "client_count": BASELINE["client_count"]
+        }
+    }
+    
+    env_var = TEST_CONFIGS[dimension]["env_var"]
+    if env_var:
+        # Standard env var dimensions (buffer_size, size_ratio, thread_count)
+        setup["env_vars"] = {env_var: value}
+    else:
+        DIMENSION_SETUPS[dimension](setup, value)
+    
+    return setup
+
+# Dimensions whose values only change run_benchmark_test arguments, so one server and data load can serve
+# several values in a row, as long as the benchmarks in between leave the loaded data unchanged
+SHARED_SERVER_DIMENSIONS = {"query_distribution", "read_write_ratio", "client_count"}
+
+# How the dimensions that aren't server env vars change the baseline test setup
+DIMENSION_SETUPS = {
+    "data_size": lambda setup, value: setup.update(data_size=value),
+    "data_distribution": lambda setup, value: setup.update(data_distribution=value),
+    "query_distribution": lambda setup, value: setup["benchmark"].update(query_distribution=value),
+    # Always use "mixed" operation for read/write ratio
+    "read_write_ratio": lambda setup, value: setup["benchmark"].update(operation="mixed", read_write_ratio=value),
+    "client_count": lambda setup, value: setup["benchmark"].update(client_count=value)
+}
+
+def generate_all_plots(plot_jobs):
+    """Generate plots for several dimensions in parallel, one worker process per dimension"""
+    workers = min(len(plot_jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [generate_plots(*job) for job in plot_jobs]
+    
+    # Plotting is CPU-bound in matplotlib, so the dimensions need separate processes to run side by side
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_plots, *zip(*plot_jobs)))
+
+def wait_for_exit(proc, timeout):
+    """Wait up to timeout seconds for proc to exit, returning whether it did"""
+    # A pidfd becomes readable the moment the process exits, so there is no polling interval to wait out
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pass  # Already reaped, or the kernel is older than 5.3
+        else:
+            try:
+                select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            return proc.poll() is not None
+    try:
+        proc.wait(timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        return False
+
+def stop_server(server_proc):
+    """Stop a server started by start_server and close its log, returning whether it exited cleanly"""
+    pidfd = None
+    if hasattr(signal, "pidfd_send_signal") and server_proc.poll() is None:
+        try:
+            pidfd = os.pidfd_open(server_proc.pid)
+        except OSError:
+            pass  # Kernel older than 5.3, fall back to signalling by PID
+    
+    if pidfd is not None:
+        # Signals sent through the pidfd can only reach our server, never a process that reused its PID
+        try:
+            try:
+                signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+                clean = bool(select.select([pidfd], [], [], 5)[0])
+            except ProcessLookupError:
+                clean = True  # Exited before the signal arrived
+            if not clean:
+                # SIGKILL the server through the pidfd, then the rest of the session start_server gave it.
+                # The server isn't reaped until the wait below, so its PID, which is also the session's
+                # process group ID, can't have been reused when the group is signalled by ID
+                with contextlib.suppress(ProcessLookupError):
+                    signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(server_proc.pid, signal.SIGKILL)
+        finally:
+            os.close(pidfd)
+        server_proc.wait()
+    else:
+        server_proc.terminate()
+        clean = wait_for_exit(server_proc, 5)
+        if not clean:
+            kill_server_session(server_proc)
+    live_servers.discard(server_proc)
+    if hasattr(server_proc, 'log_file'):
+        server_proc.log_file.close()
+    return clean
+
+@contextlib.contextmanager
+def managed_server(env_vars=None):
+    """Start a server for the duration of a with block and stop it however the block exits"""
+    server_proc = start_server(env_vars)
+    try:
+        yield server_proc
+    finally:
+        if not stop_server(server_proc):
+            print("Server didn't terminate gracefully, forced it to stop")
+
+def test_dimension(dimension, operation="get", auto_continue=True, plot_jobs=None):
     """Run tests for a specific dimension with all its values"""
     config = TEST_CONFIGS[dimension]
     values = config["values"]
-    env_var = config["env_var"]
     plot_dir = config["plot_dir"]
     
     print(f"\n{'='*80}")
@@ -1286,204 +1580,44 @@ def test_dimension(dimension, operation="get", auto_continue=True):
     print(f"Testing values: {values}")
     print(f"Operation: {operation}")
     
-    # Create results directory for this dimension
-    os.makedirs(plot_dir, exist_ok=True)
-    
     metrics_dict = {}  # To store metrics for each value
     
-    # Test each value of the dimension
-    for value in values:
-        print(f"\n{'-'*60}")
-        print(f"Testing {dimension} = {value}")
-        print(f"{'-'*60}")
-        
-        # Clean up previous server
-        cleanup_processes()
-        
-        # Special handling for different dimensions
-        if dimension == "data_size":
-            # Generate data file
-            data_file = generate_test_data(value, BASELINE["data_distribution"])
-            
-            # Start server with baseline settings
-            server_proc = start_server()
-            
-            try:
-                # Load the data
-                if not load_data(data_file):
-                    print(f"Failed to load data for {dimension} = {value}. Skipping.")
-                    continue
-                    
-                # Verify data loaded
-                if not verify_data_loaded():
-                    print(f"Warning: Could not verify data was loaded for {dimension} = {value}.")
-                    if not auto_continue:
-                        response = input("Continue anyway? (y/n): ")
-                        if response.lower() != 'y':
-                            continue
-                
-                # Run benchmark test - make sure we specify the correct operation
-                if operation == "get":
-                    # Run get-only benchmark 
-                    success, metrics = run_benchmark_test("get",
-                                                       query_distribution=BASELINE["query_distribution"],
-                                                       read_write_ratio=1,  # All reads
-                                                       client_count=BASELINE["client_count"])
-                elif operation == "put":
-                    # Run put-only benchmark
-                    success, metrics = run_benchmark_test("put",
-                                                       query_distribution=BASELINE["query_distribution"],
-                                                       read_write_ratio=0,  # All writes
-                                                       client_count=BASELINE["client_count"])
-                else:
-                    # Mixed mode or other operations
-                    success, metrics = run_benchmark_test(operation,
-                                                       query_distribution=BASELINE["query_distribution"],
-                                                       read_write_ratio=BASELINE["read_write_ratio"],
-                                                       client_count=BASELINE["client_count"])
-                
-                if success and metrics:
-                    print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
-                    metrics_dict[value] = metrics
-                else:
-                    print(f"DEBUG: No metrics for {dimension}={value}, success={success}")
-                
-            finally:
-                # Clean up server
-                try:
-                    server_proc.terminate()
-                    server_proc.wait(timeout=5)
-                except:
-                    server_proc.kill()
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
-                    
-        elif dimension == "data_distribution":
-            # Generate data file with specific distribution
-            data_file = generate_test_data(BASELINE["data_size"], value)
-            
-            # Start server with baseline settings
-            server_proc = start_server()
+    # Dimensions that only change the benchmark keep one loaded server while its data is unchanged
+    share_server = dimension in SHARED_SERVER_DIMENSIONS
+    server_proc = None
+    server_reusable = False
+    # Once our own server has exited on SIGTERM there is nothing left for cleanup_processes to find
+    server_stopped_cleanly = False
+    
+    try:
+        # Test each value of the dimension
+        for value in values:
+            print(f"\n{'-'*60}")
+            print(f"Testing {dimension} = {value}")
+            print(f"{'-'*60}")
             
-            try:
-                # Load the data
-                if not load_data(data_file):
-                    print(f"Failed to load data for {dimension} = {value}. Skipping.")
-                    continue
-                    
-                # Verify data loaded
-                if not verify_data_loaded():
-                    print(f"Warning: Could not verify data was loaded for {dimension} = {value}.")
-                    if not auto_continue:
-                        response = input("Continue anyway? (y/n): ")
-                        if response.lower() != 'y':
-                            continue
-                
-                # Run benchmark test
-                success, metrics = run_benchmark_test(operation)
-                if success and metrics:
-                    print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
-                    metrics_dict[value] = metrics
-                else:
-                    print(f"DEBUG: No metrics for {dimension}={value}, success={success}")
-                
-            finally:
-                # Clean up server
-                try:
-                    server_proc.terminate()
-                    server_proc.wait(timeout=5)
-                except:
-                    server_proc.kill()
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
-                    
-        elif dimension == "query_distribution":
-            # Generate baseline data file
-            data_file = generate_test_data(BASELINE["data_size"], BASELINE["data_distribution"])
+            setup = dimension_test_setup(dimension, value, operation)
             
-            # Start server with baseline settings
-            server_proc = start_server()
+            if server_proc is not None and not server_reusable:
+                server_stopped_cleanly = stop_server(server_proc)
+                server_proc = None
             
-            try:
-                # Load the data
-                if not load_data(data_file):
-                    print(f"Failed to load data for {dimension} = {value}. Skipping.")
-                    continue
-                    
-                # Verify data loaded
-                if not verify_data_loaded():
-                    print(f"Warning: Could not verify data was loaded for {dimension} = {value}.")
-                    if not auto_continue:
-                        response = input("Continue anyway? (y/n): ")
-                        if response.lower() != 'y':
-                            continue
+            if server_proc is None:
+                # Clean up previous server
+                if not server_stopped_cleanly:
+                    cleanup_processes()
                 
-                # Run benchmark test with specified query distribution
-                success, metrics = run_benchmark_test(operation, query_distribution=value)
-                if success and metrics:
-                    print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
-                    metrics_dict[value] = metrics
+                # Generate data file
+                data_file = generate_test_data(setup["data_size"], setup["data_distribution"])
                 
-            finally:
-                # Clean up server
-                try:
-                    server_proc.terminate()
-                    server_proc.wait(timeout=5)
-                except:
-                    server_proc.kill()
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
-                    
-        elif dimension == "read_write_ratio":
-            # Generate baseline data file
-            data_file = generate_test_data(BASELINE["data_size"], BASELINE["data_distribution"])
-            
-            # Start server with baseline settings
-            server_proc = start_server()
-            
-            try:
-                # Load the data
-                if not load_data(data_file):
-                    print(f"Failed to load data for {dimension} = {value}. Skipping.")
-                    continue
-                    
-                # Verify data loaded
-                if not verify_data_loaded():
-                    print(f"Warning: Could not verify data was loaded for {dimension} = {value}.")
-                    if not auto_continue:
-                        response = input("Continue anyway? (y/n): ")
-                        if response.lower() != 'y':
-                            continue
+                # Start server with this value's settings
+                server_proc = start_server(setup["env_vars"])
                 
-                # Always use "mixed" operation for read/write ratio
-                success, metrics = run_benchmark_test("mixed", 
-                                                     query_distribution=BASELINE["query_distribution"],
-                                                     read_write_ratio=value)
-                if success and metrics:
-                    print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
-                    metrics_dict[value] = metrics
-                
-            finally:
-                # Clean up server
-                try:
-                    server_proc.terminate()
-                    server_proc.wait(timeout=5)
-                except:
-                    server_proc.kill()
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
-                    
-        elif dimension == "client_count":
-            # Generate baseline data file
-            data_file = generate_test_data(BASELINE["data_size"], BASELINE["data_distribution"])
-            
-            # Start server with baseline settings
-            server_proc = start_server()
-            
-            try:
                 # Load the data
                 if not load_data(data_file):
                     print(f"Failed to load data for {dimension} = {value}. Skipping.")
+                    server_stopped_cleanly = stop_server(server_proc)
+                    server_proc = None
                     continue
                     
                 # Verify data loaded
@@ -1492,87 +1626,62 @@ def test_dimension(dimension, operation="get", auto_continue=True):
                     if not auto_continue:
                         response = input("Continue anyway? (y/n): ")
                         if response.lower() != 'y':
+                            server_stopped_cleanly = stop_server(server_proc)
+                            server_proc = None
                             continue
-                
-                # Run benchmark test with specified client count
-                success, metrics = run_benchmark_test(operation, 
-                                                    query_distribution=BASELINE["query_distribution"],
-                                                    read_write_ratio=BASELINE["read_write_ratio"],
-                                                    client_count=value)
-                if success and metrics:
-                    print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
-                    metrics_dict[value] = metrics
-                
-            finally:
-                # Clean up server
-                try:
-                    server_proc.terminate()
-                    server_proc.wait(timeout=5)
-                except:
-                    server_proc.kill()
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
-        
-        # Standard env var dimensions (buffer_size, size_ratio, thread_count)
-        else:
-            # Set the env var for this test
-            env_vars = {env_var: value}
-            
-            # Start server with this setting
-            server_proc = start_server(env_vars)
+            else:
+                debug_print(f"Reusing the loaded server for {dimension} = {value}")
             
-            try:
-                # Generate and load baseline data
-                data_file = generate_test_data(BASELINE["data_size"], BASELINE["data_distribution"])
-                
-                # Load the data
-                if not load_data(data_file):
-                    print(f"Failed to load data for {dimension} = {value}. Skipping.")
-                    continue
-                    
-                # Verify data loaded
-                if not verify_data_loaded():
-                    print(f"Warning: Could not verify data was loaded for {dimension} = {value}.")
-                    if not auto_continue:
-                        response = input("Continue anyway? (y/n): ")
-                        if response.lower() != 'y':
-                            continue
-                
-                # Run benchmark test
-                success, metrics = run_benchmark_test(operation)
-                if success and metrics:
-                    print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
-                    metrics_dict[value] = metrics
-                    
-            finally:
-                # Clean up server
-                try:
-                    server_proc.terminate()
-                    server_proc.wait(timeout=5)
-                except:
-                    server_proc.kill()
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
+            # Run benchmark test
+            success, metrics = run_benchmark_test(**setup["benchmark"])
+            # Puts stay in the tree and would grow the next value's dataset, so only reads leave it reusable
+            server_reusable = share_server and setup["benchmark"]["operation"] == "get"
+            if success and metrics:
+                print(f"DEBUG: Got metrics for {dimension}={value}: {metrics}")
+                metrics_dict[value] = metrics
+            else:
+                print(f"DEBUG: No metrics for {dimension}={value}, success={success}")
+    
+    finally:
+        # Clean up server
+        if server_proc is not None:
+            stop_server(server_proc)
     
     # If we collected metrics, save to CSV and generate plots
     if metrics_dict:
         print(f"DEBUG: Collected metrics for {len(metrics_dict)} values of {dimension}")
         csv_file = save_metrics_to_csv(dimension, values, metrics_dict, operation, plot_dir)
-        print(f"DEBUG: About to generate plots for {dimension} with CSV file {csv_file}")
-        generate_plots(dimension, values, metrics_dict, operation, plot_dir, config)
+        # Callers collecting plot_jobs generate the plots themselves later
+        if plot_jobs is None:
+            print(f"DEBUG: About to generate plots for {dimension} with CSV file {csv_file}")
+            generate_plots(dimension, values, metrics_dict, operation, plot_dir, config)
+        else:
+            plot_jobs.append((dimension, values, metrics_dict, operation, plot_dir, config))
         print(f"\nCompleted testing for {dimension} dimension")
         return True
     else:
         print(f"\nDEBUG: No metrics collected for {dimension} dimension!")
         return False
 
+def run_dimension_worker(dimension, operation, auto_continue, worker_index):
+    """Run test_dimension in a worker process with its own server port and output directory"""
+    global server_port, dimension_worker_dir
+    server_port = SERVER_PORT + 1 + worker_index
+    # Pool workers are reused across dimensions, so the directory is built from the fixed base
+    dimension_worker_dir = os.path.join(PROJECT_ROOT, "results", dimension)
+    os.makedirs(dimension_worker_dir, exist_ok=True)
+    
+    # The parent generates the plots once every worker is done
+    plot_jobs = []
+    success = test_dimension(dimension, operation, auto_continue, plot_jobs)
+    return success, plot_jobs
+
 def run_performance_benchmark():
     """Run specific performance benchmarks to measure if we meet expected metrics"""
     print("\n=== LSM-TREE PERFORMANCE BENCHMARK ===")
     
     # Create necessary directories
     os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(RESULTS_DIR, exist_ok=True)
     
     # Clean up any existing server processes
     cleanup_processes()
@@ -1591,128 +1700,80 @@ def run_performance_benchmark():
     try:
         # Start with standard buffer
         env_vars = {"LSMTREE_BUFFER_SIZE": 4 * 1024 * 1024}  # 4MB buffer
-        server_proc = start_server(env_vars)
-        
-        # Load the data
-        if not load_data(data_file):
-            print("Failed to load test data. Aborting performance benchmark.")
-            return
-            
-        # Verify data loaded
-        if not verify_data_loaded():
-            print("Warning: Could not verify data was loaded.")
-            
-        print("\n--- Testing disk operations ---")
-        print("Running read benchmark (key lookup from disk)...")
-        
-        # Run read benchmark - keys should be on disk due to the smaller buffer
-        success, metrics = run_benchmark_test(operation="get", 
-                                             query_distribution="uniform",
-                                             read_write_ratio=1,
-                                             client_count=1)
-                                             
-        if success and metrics:
-            results["disk_reads"] = metrics.get('read_throughput')
-            print(f"Disk read performance: {results['disk_reads']:.2f} operations/second")
-            
-        # Run write benchmark
-        print("Running write benchmark (puts that cause disk I/O)...")
-        success, metrics = run_benchmark_test(operation="put", 
-                                             query_distribution="uniform",
-                                             read_write_ratio=0,
-                                             client_count=1)
-                                             
-        if success and metrics:
-            results["disk_writes"] = metrics.get('write_throughput')
-            print(f"Disk write performance: {results['disk_writes']:.2f} operations/second")
-            
-        # Clean up server - improved shutdown process
-        print("Shutting down server after disk tests...")
-        try:
-            # Send SIGTERM signal
-            server_proc.terminate()
-            
-            # Give some time for graceful shutdown
-            for _ in range(10):  # Try for up to 10 seconds
-                if server_proc.poll() is not None:
-                    break  # Process has terminated
-                time.sleep(1)
+        with managed_server(env_vars):
+            # Load the data
+            if not load_data(data_file):
+                print("Failed to load test data. Aborting performance benchmark.")
+                return
                 
-            # If still running, force kill
-            if server_proc.poll() is None:
-                print("Server didn't terminate gracefully, forcing...")
-                server_proc.kill()
-                server_proc.wait(timeout=2)  # Shorter timeout for kill
+            # Verify data loaded
+            if not verify_data_loaded():
+                print("Warning: Could not verify data was loaded.")
+                
+            print("\n--- Testing disk operations ---")
+            print("Running read benchmark (key lookup from disk)...")
             
-            # Close log file
-            if hasattr(server_proc, 'log_file'):
-                server_proc.log_file.close()
-        except Exception as e:
-            print(f"Error during server shutdown: {e}")
+            # Run read benchmark - keys should be on disk due to the smaller buffer
+            success, metrics = run_benchmark_test(operation="get", 
+                                                 query_distribution="uniform",
+                                                 read_write_ratio=1,
+                                                 client_count=1)
+                                                 
+            if success and metrics:
+                results["disk_reads"] = metrics.get('read_throughput')
+                print(f"Disk read performance: {results['disk_reads']:.2f} operations/second")
+                
+            # Run write benchmark
+            print("Running write benchmark (puts that cause disk I/O)...")
+            success, metrics = run_benchmark_test(operation="put", 
+                                                 query_distribution="uniform",
+                                                 read_write_ratio=0,
+                                                 client_count=1)
+                                                 
+            if success and metrics:
+                results["disk_writes"] = metrics.get('write_throughput')
+                print(f"Disk write performance: {results['disk_writes']:.2f} operations/second")
+                
+            print("Shutting down server after disk tests...")
         
-        # Ensure clean slate
+        # Ensure clean slate; this also waits for the port to be released
         cleanup_processes()
-        time.sleep(2)  # Additional delay to ensure ports are released
         
         # Now test with a massive buffer to keep everything in memory
         print("\n--- Testing in-memory operations ---")
         env_vars = {"LSMTREE_BUFFER_SIZE": 1024 * 1024 * 1024}  # 1GB buffer
-        server_proc = start_server(env_vars)
-        
-        # Load a small amount of data
-        small_data_file = generate_test_data(1 * 1024 * 1024, "uniform")  # 1MB file
-        
-        if not load_data(small_data_file):
-            print("Failed to load small test data. Skipping memory benchmark.")
-        else:
-            # Run read benchmark - keys should be in memory
-            print("Running in-memory read benchmark...")
-            success, metrics = run_benchmark_test(operation="get", 
-                                                query_distribution="uniform",
-                                                read_write_ratio=1,
-                                                client_count=1)
-                                                
-            if success and metrics:
-                results["in_memory_reads"] = metrics.get('read_throughput')
-                print(f"In-memory read performance: {results['in_memory_reads']:.2f} operations/second")
-                
-            # Run write benchmark - should stay in buffer
-            print("Running in-memory write benchmark...")
-            success, metrics = run_benchmark_test(operation="put", 
-                                                query_distribution="uniform",
-                                                read_write_ratio=0,
-                                                client_count=1)
-                                                
-            if success and metrics:
-                results["in_memory_writes"] = metrics.get('write_throughput')
-                print(f"In-memory write performance: {results['in_memory_writes']:.2f} operations/second")
+        with managed_server(env_vars):
+            # Load a small amount of data
+            small_data_file = generate_test_data(1 * 1024 * 1024, "uniform")  # 1MB file
+            
+            if not load_data(small_data_file):
+                print("Failed to load small test data. Skipping memory benchmark.")
+            else:
+                # Run read benchmark - keys should be in memory
+                print("Running in-memory read benchmark...")
+                success, metrics = run_benchmark_test(operation="get", 
+                                                    query_distribution="uniform",
+                                                    read_write_ratio=1,
+                                                    client_count=1)
+                                                    
+                if success and metrics:
+                    results["in_memory_reads"] = metrics.get('read_throughput')
+                    print(f"In-memory read performance: {results['in_memory_reads']:.2f} operations/second")
+                    
+                # Run write benchmark - should stay in buffer
+                print("Running in-memory write benchmark...")
+                success, metrics = run_benchmark_test(operation="put", 
+                                                    query_distribution="uniform",
+                                                    read_write_ratio=0,
+                                                    client_count=1)
+                                                    
+                if success and metrics:
+                    results["in_memory_writes"] = metrics.get('write_throughput')
+                    print(f"In-memory write performance: {results['in_memory_writes']:.2f} operations/second")
             
     finally:
-        # Ensure cleanup happens regardless of any errors
+        # managed_server has already stopped our servers; make sure nothing stray is left running
         print("Cleaning up resources...")
-        try:
-            # Send SIGTERM signal
-            if 'server_proc' in locals() and server_proc.poll() is None:
-                server_proc.terminate()
-                
-                # Give some time for graceful shutdown
-                for _ in range(5):  # Try for up to 5 seconds
-                    if server_proc.poll() is not None:
-                        break  # Process has terminated
-                    time.sleep(1)
-                    
-                # If still running, force kill
-                if server_proc.poll() is None:
-                    print("Server didn't terminate gracefully, forcing...")
-                    server_proc.kill()
-                
-                # Close log file
-                if hasattr(server_proc, 'log_file'):
-                    server_proc.log_file.close()
-        except Exception as e:
-            print(f"Error during final cleanup: {e}")
-        
-        # Always make sure to clean up any stray processes
         cleanup_processes()
         
     # Evaluate against expected metrics
@@ -1745,8 +1806,6 @@ def main():
     """Run tests for all dimensions or specific dimension(s)"""
     # Create necessary directories
     os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(RESULTS_DIR, exist_ok=True)
-    os.makedirs(PLOTS_DIR, exist_ok=True)
     
     # Clean up any existing server processes
     cleanup_processes()
@@ -1754,7 +1813,7 @@ def main():
     # Parse command-line arguments
     import argparse
     parser = argparse.ArgumentParser(description='Run LSM-Tree performance tests')
-    parser.add_argument('--dimensions', nargs='+', choices=TEST_CONFIGS.keys(),
+    parser.add_argument('--dimensions', nargs='+', choices=sorted(DIM_CHOICES),
                         help='Specific dimensions to test (default: all)')
     parser.add_argument('--operation', choices=['get', 'put', 'delete', 'mixed'], default='mixed',
                         help='Operation to benchmark (default: mixed)')
@@ -1762,9 +1821,23 @@ def main():
                         help='Automatically continue if verification fails')
     parser.add_argument('--performance-profile', action='store_true',
                         help='Run a specific performance profile to check against expected metrics')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Regenerate the test data files and their manifest entries instead of reusing '
+                             'cached ones (the seed is fixed, so this repairs damaged files rather than '
+                             'producing new data)')
+    parser.add_argument('--parallel', nargs='?', type=int, const=0, metavar='N',
+                        help='Test up to N dimensions at the same time, each with its own server '
+                             '(default N: half the CPU count). The servers compete for the machine, so '
+                             'throughput and latency are not comparable with serial runs')
     
     args = parser.parse_args()
     
+    # Without the cache, only files generated during this run are reused. Every file is rewritten
+    # from DATA_SEED and its fingerprint re-recorded, so runs stay comparable with cached ones
+    global fresh_data_keys
+    if args.no_cache:
+        fresh_data_keys = set()
+    
     # If performance profile is requested, run it and exit
     if args.performance_profile:
         run_performance_benchmark()
@@ -1787,24 +1860,67 @@ def main():
     successful_dimensions = 0
     failed_dimensions = 0
     
-    for dimension in dimensions_to_test:
-        start_time = time.time()
-        
-        success = test_dimension(
-            dimension=dimension,
-            operation=args.operation,
-            auto_continue=args.auto_continue
-        )
-        
-        elapsed = time.time() - start_time
-        minutes, seconds = divmod(elapsed, 60)
-        
-        print(f"Dimension {dimension} completed in {int(minutes)}m {seconds:.2f}s")
-        
-        if success:
-            successful_dimensions += 1
+    # Plots are generated together once all benchmarks are done so they don't compete with the server
+    plot_jobs = []
+    
+    # Every dimension worker runs a server and its clients, so by default leave half the CPUs to them
+    parallel_workers = 1
+    if args.parallel is not None:
+        parallel_workers = min(args.parallel or (os.cpu_count() or 1) // 2, len(dimensions_to_test))
+    
+    # Plots for the dimensions that finished are drawn even if a later one aborts the run
+    try:
+        if parallel_workers > 1:
+            # Generate every data file up front so no two workers write the same file
+            for dimension in dimensions_to_test:
+                for value in TEST_CONFIGS[dimension]["values"]:
+                    setup = dimension_test_setup(dimension, value, args.operation)
+                    generate_test_data(setup["data_size"], setup["data_distribution"])
+            
+            # The dimensions share no server state, so each worker runs one with its own server
+            print(f"\nTesting {len(dimensions_to_test)} dimensions with {parallel_workers} parallel workers...")
+            print(f"WARNING: {PARALLEL_RESULTS_WARNING}")
+            with ProcessPoolExecutor(max_workers=parallel_workers) as executor:
+                # Every dimension gets its own port, even when it waits for a free worker
+                futures = {
+                    executor.submit(run_dimension_worker, dimension, args.operation, args.auto_continue, worker_index): dimension
+                    for worker_index, dimension in enumerate(dimensions_to_test)
+                }
+                
+                # Report each dimension as soon as its worker is done
+                for future in as_completed(futures):
+                    success, worker_plot_jobs = future.result()
+                    print(f"Dimension {futures[future]} {'succeeded' if success else 'failed'}")
+                    plot_jobs.extend(worker_plot_jobs)
+                    
+                    if success:
+                        successful_dimensions += 1
+                    else:
+                        failed_dimensions += 1
         else:
-            failed_dimensions += 1
+            for dimension in dimensions_to_test:
+                start_time = time.time()
+                
+                success = test_dimension(
+                    dimension=dimension,
+                    operation=args.operation,
+                    auto_continue=args.auto_continue,
+                    plot_jobs=plot_jobs
+                )
+                
+                elapsed = time.time() - start_time
+                minutes, seconds = divmod(elapsed, 60)
+                
+                print(f"Dimension {dimension} completed in {int(minutes)}m {seconds:.2f}s")
+                
+                if success:
+                    successful_dimensions += 1
+                else:
+                    failed_dimensions += 1
+    finally:
+        if plot_jobs:
+            print(f"\nGenerating plots for {len(plot_jobs)} dimensions...")
+            generate_all_plots(plot_jobs)
     
     # Record end time and print summary
     overall_elapsed = time.time() - overall_start
@@ -1820,21 +1936,26 @@ def main():
     print(f"Failed: {failed_dimensions}")
     print(f"Results saved to: {RESULTS_DIR}")
     print(f"Plots saved to: {PLOTS_DIR}")
+    if parallel_workers > 1:
+        print(f"WARNING: {PARALLEL_RESULTS_WARNING}")
     
     # Generate a report with all results
     print("\nGenerating consolidated report and plots...")
-    generate_consolidated_report(dimensions_to_test, args.operation)
+    generate_consolidated_report(dimensions_to_test, args.operation, parallel=parallel_workers > 1)
 
-def generate_consolidated_report(dimensions, operation):
+def generate_consolidated_report(dimensions, operation, parallel=False):
     """Generate a consolidated report of all test results"""
     report_path = os.path.join(RESULTS_DIR, f"consolidated_report_{operation}.txt")
     
-    with open(report_path, 'w') as f:
+    # Build the report in memory and write it out in one go
+    with io.StringIO() as f:
         f.write(f"LSM-TREE PERFORMANCE REPORT - {operation.upper()} OPERATIONS\n")
         f.write("="*80 + "\n\n")
         
         # Add date and time
         f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        if parallel:
+            f.write(f"WARNING: {PARALLEL_RESULTS_WARNING}\n\n")
         
         # Add baseline configuration
         f.write("Baseline Configuration:\n")
@@ -1860,6 +1981,14 @@ def generate_consolidated_report(dimensions, operation):
                 
             f.write(f"  Tested values: {', '.join(values)}\n")
             f.write(f"  Plots: {config['plot_dir']}\n\n")
+        
+        report = f.getvalue()
+    
+    # Replace the old report atomically so a reader never sees a partial one
+    tmp_path = report_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(report)
+    os.replace(tmp_path, report_path)
     
     print(f"Consolidated report saved to {report_path}")
 
@@ -0,0 +1,14 @@
+"""Helpers shared by the test scripts"""
+import time
+
+def wait_with_backoff(condition, timeout, max_delay=1.0):
+    """Poll condition with exponentially growing delays from 10ms, returning whether it held before timeout"""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while not condition():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+    return True
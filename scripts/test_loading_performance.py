@@ -4,69 +4,172 @@ import sys
 import time
 import subprocess
 import tempfile
-import random
-import struct
+import shutil
 import signal
 import threading
+import numpy as np
+from script_utils import wait_with_backoff
 
-def generate_test_data(size_bytes, output_file):
-    """Generate test data file with specified size"""
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Fall back to pkill for process cleanup
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None  # Fall back to NumPy's generator for the test data
+
+# Generated data files are kept next to master_test.py's so later runs can reuse them
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "data", "test_data")
+# Seed for cached data files, so every run with the same size loads the same data
+DATA_SEED = 42
+
+# Each record is an 8-byte key followed by an 8-byte value, both little-endian
+RECORD_SIZE = 16
+# Keys and values are drawn from the non-negative signed 64-bit range
+MAX_KEY = 2**63 - 1
+# Records generated per chunk, so a 200MB file never has to sit in memory (16MiB per chunk)
+CHUNK_RECORDS = 1024 * 1024
+
+if njit is not None:
+    @njit(cache=True)
+    def splitmix64(state):
+        """Mix a SplitMix64 state into its 64-bit output"""
+        z = (state ^ (state >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+    
+    @njit(parallel=True, cache=True)
+    def fill_records(buf, seed, offset):
+        """Fill buf with values offset.. of the SplitMix64 stream for seed, shifted into the key range"""
+        # Each value depends only on its index, so the threads split the buffer without sharing state
+        for i in prange(buf.size):
+            state = np.uint64(seed) + (np.uint64(offset + i) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+            buf[i] = splitmix64(state) >> np.uint64(1)
+else:
+    fill_records = None
+
+# Numba and NumPy draw different data from the same seed, so the generator is part of the cache key
+DATA_GENERATOR = "numba" if fill_records is not None else "numpy"
+
+def generate_test_data(size_bytes, output_file, seed=None):
+    """Generate test data file with specified size, from a random seed unless one is given"""
     print(f"Generating {size_bytes/1024/1024:.2f}MB test data...")
     
-    records_count = size_bytes // 16  # Each record is 16 bytes (8-byte key, 8-byte value)
+    records_count = size_bytes // RECORD_SIZE  # Each record is 16 bytes (8-byte key, 8-byte value)
+    
+    # Draw the keys and values one chunk at a time; interleaved they are exactly the key/value record layout
+    if fill_records is not None:
+        # The Numba kernel fills one reused buffer in parallel
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+        buf = np.empty(CHUNK_RECORDS * 2, dtype=np.uint64)
+    else:
+        rng = np.random.default_rng(seed)
     
-    with open(output_file, 'wb') as f:
-        for i in range(records_count):
-            key = random.randint(0, 2**63 - 1)
-            value = random.randint(0, 2**63 - 1)
-            f.write(struct.pack("<QQ", key, value))
+    # The file is preallocated, so it is written under a temporary name and only renamed into place
+    # once complete; an interrupted run must never leave a full-size file of zeros to be reused
+    tmp_file = output_file + ".tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            # Reserve the whole file up front so it is laid out contiguously
+            try:
+                os.posix_fallocate(f.fileno(), 0, records_count * RECORD_SIZE)
+            except (AttributeError, OSError):
+                pass  # Not supported on this platform/filesystem
+            
+            for start in range(0, records_count, CHUNK_RECORDS):
+                n = min(CHUNK_RECORDS, records_count - start)
+                if fill_records is not None:
+                    records = buf[:n * 2]
+                    fill_records(records, seed, start * 2)
+                else:
+                    records = rng.integers(0, MAX_KEY, size=n * 2, dtype=np.int64, endpoint=True)
+                records.astype(records.dtype.newbyteorder('<'), copy=False).tofile(f)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+        raise
+    os.replace(tmp_file, output_file)
     
     actual_size = os.path.getsize(output_file)
     print(f"Generated file size: {actual_size/1024/1024:.2f}MB with {records_count:,} records")
     
     return output_file
 
+def cached_test_data(size_bytes):
+    """Return a data file of the given size, generating it only if no earlier run left one"""
+    output_file = os.path.join(DATA_DIR, f"loading_{size_bytes}_{DATA_SEED}_{DATA_GENERATOR}.bin")
+    records_bytes = size_bytes // RECORD_SIZE * RECORD_SIZE
+    if os.path.exists(output_file) and os.path.getsize(output_file) == records_bytes:
+        print(f"Using cached {size_bytes/1024/1024:.2f}MB test data: {output_file}")
+        return output_file
+    
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return generate_test_data(size_bytes, output_file, seed=DATA_SEED)
+
+def prefetch_data_file(data_file):
+    """Ask the kernel to read a data file into the page cache before the server loads it"""
+    # Cached and fresh files alike, so every run's load starts from the same warm page cache
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(data_file, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
 def cleanup_processes():
     """Kill any running server processes"""
     try:
-        os.system("pkill -f 'bin/server'")
+        if psutil is None:
+            os.system("pkill -f 'bin/server'")
+            # Give processes up to a second to terminate, checking often at first
+            wait_with_backoff(lambda: subprocess.run(["pgrep", "-f", "bin/server"],
+                                                     stdout=subprocess.DEVNULL).returncode != 0, 1.0)
+        else:
+            # Signal the servers directly and only wait as long as they take to exit
+            server_procs = [
+                proc for proc in psutil.process_iter(['cmdline', 'status'])
+                if proc.info['status'] != psutil.STATUS_ZOMBIE
+                and proc.info['cmdline'] and proc.info['cmdline'][0].endswith("bin/server")
+            ]
+            for proc in server_procs:
+                try:
+                    proc.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+            
+            _, alive = psutil.wait_procs(server_procs, timeout=1)
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            psutil.wait_procs(alive, timeout=1)
         print("Cleaned up any existing server processes")
-        time.sleep(1)
     except Exception as e:
         print(f"Error cleaning up processes: {e}")
 
-def monitor_server_logs(server_log_path, stop_event, success_event):
-    """Monitor and display server logs in real-time"""
-    last_position = 0
-    
+def monitor_server_logs(server_pipe, server_log, success_event):
+    """Monitor and display server logs in real-time, saving them to server_log"""
     print("\n--- Server Log Monitor Started ---")
     
-    while not stop_event.is_set():
-        # Check if the log file exists
-        if os.path.exists(server_log_path):
-            with open(server_log_path, 'r') as f:
-                # Go to the last position we read
-                f.seek(last_position)
-                
-                # Read and print new content
-                new_content = f.read()
-                if new_content:
-                    print(new_content, end='', flush=True)
-                    
-                    # Check if server started in non-interactive mode
-                    if "Server running in non-interactive mode" in new_content:
-                        print("\n>>> Server confirmed running in non-interactive mode <<<\n", flush=True)
-                    
-                    # Check if bulk load completed
-                    if "Bulk load completed successfully" in new_content:
-                        print("\n>>> BULK LOAD COMPLETED SUCCESSFULLY - WILL TERMINATE PROCESSES <<<\n", flush=True)
-                        success_event.set()
-                
-                # Update the last position
-                last_position = f.tell()
+    # Each readline wakes us as soon as the server writes a line; EOF means the server exited
+    for raw_line in iter(server_pipe.readline, b''):
+        line = raw_line.decode(errors='replace')
+        print(line, end='', flush=True)
+        server_log.write(line)
         
-        # Wait a bit before checking again
-        time.sleep(0.5)
+        # Check if server started in non-interactive mode
+        if "Server running in non-interactive mode" in line:
+            print("\n>>> Server confirmed running in non-interactive mode <<<\n", flush=True)
+        
+        # Check if bulk load completed
+        if "Bulk load completed successfully" in line:
+            print("\n>>> BULK LOAD COMPLETED SUCCESSFULLY - WILL TERMINATE PROCESSES <<<\n", flush=True)
+            success_event.set()
     
     print("\n--- Server Log Monitor Stopped ---")
 
@@ -77,6 +180,8 @@ def test_loading_performance(data_file):
     # Cleanup any existing processes
     cleanup_processes()
     
+    prefetch_data_file(data_file)
+    
     # Create command file for loading
     with tempfile.NamedTemporaryFile(mode='w', delete=False) as cmd_file:
         cmd_file_path = cmd_file.name
@@ -90,35 +195,33 @@ def test_loading_performance(data_file):
     server_log_path = "server_output.log"
     server_log = open(server_log_path, "w")
     
-    # Start server
+    # Start server; its output is read straight from a pipe and saved to the log by the monitor
     print("Starting server in non-interactive mode...")
     server_proc = subprocess.Popen(
         ["./bin/server"],
         stdin=subprocess.DEVNULL,  # Redirect stdin to /dev/null to prevent waiting for input
-        stdout=server_log,
-        stderr=server_log,
-        text=True
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT  # Default buffering so readline pulls whole chunks, not one byte per syscall
     )
     
-    # Give the server a moment to start
-    time.sleep(2)
-    print("Server started with PID:", server_proc.pid)
-    
-    # Set up events for coordination
-    stop_monitor = threading.Event()
+    # Set up event for coordination
     success_event = threading.Event()  # New event to signal successful bulk load
     
     # Set up log monitoring thread
     log_monitor = threading.Thread(
         target=monitor_server_logs, 
-        args=(server_log_path, stop_monitor, success_event)
+        args=(server_proc.stdout, server_log, success_event)
     )
     log_monitor.daemon = True
     log_monitor.start()
     
+    # Give the server a moment to start
+    time.sleep(2)
+    print("Server started with PID:", server_proc.pid)
+    
     # Run client with load command
     print("Running client to load data...")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     client_log = open("client_output.log", "w")
     
@@ -137,15 +240,17 @@ def test_loading_performance(data_file):
     
     # Wait for either success_event or timeout
     max_wait_time = 120  # 2 minutes timeout
-    wait_increment = 0.5  # Check every half second
-    waited = 0
+    deadline = time.monotonic() + max_wait_time
+    # Check the client after 10ms, then back off exponentially up to every half second
+    wait_increment = 0.01
+    max_wait_increment = 0.5
     
-    while waited < max_wait_time:
+    while time.monotonic() < deadline:
         # Check if bulk load completed
         if success_event.is_set():
             # Wait a bit to ensure all logs are captured
             time.sleep(1)
-            end_time = time.time()
+            end_time = time.perf_counter()
             elapsed = end_time - start_time
             elapsed_time_calculated = True
             print(f"Bulk load detected as successful! Elapsed time: {elapsed:.2f} seconds")
@@ -155,31 +260,25 @@ def test_loading_performance(data_file):
         if client_proc.poll() is not None:
             print(f"Client exited with code: {client_proc.returncode}")
             if not elapsed_time_calculated:
-                end_time = time.time()
+                end_time = time.perf_counter()
                 elapsed = end_time - start_time
                 elapsed_time_calculated = True
             break
         
-        # Wait and increment counter
-        time.sleep(wait_increment)
-        waited += wait_increment
+        # Wait for the load to complete or the next check, whichever comes first
+        success_event.wait(wait_increment)
+        wait_increment = min(wait_increment * 2, max_wait_increment)
     
     # If we timed out and haven't calculated elapsed time
     if not elapsed_time_calculated:
-        end_time = time.time()
+        end_time = time.perf_counter()
         elapsed = end_time - start_time
     
     # Check if bulk load completed successfully based on logs
     print("Checking if bulk load completed successfully...")
     
-    bulk_load_completed = False
-    with open(server_log_path, 'r') as f:
-        for line in f:
-            if "Bulk load completed successfully" in line:
-                bulk_load_completed = True
-                break
-    
-    if bulk_load_completed:
+    # The monitor sees every server line, so its event already says whether the load completed
+    if success_event.is_set():
         print("Bulk load completed successfully!")
     else:
         print("Warning: Could not confirm bulk load completion in logs")
@@ -210,8 +309,7 @@ def test_loading_performance(data_file):
         except:
             pass
     
-    # Stop log monitoring
-    stop_monitor.set()
+    # The monitor stops at EOF once the server has exited
     log_monitor.join(timeout=2)
     
     # Clean up
@@ -224,11 +322,20 @@ def test_loading_performance(data_file):
     print(f"Throughput: {os.path.getsize(data_file)/elapsed/1024/1024:.2f}MB/s")
     
     print("\nClient log summary:")
-    os.system("cat client_output.log")
+    with open("client_output.log", "rb") as f:
+        sys.stdout.flush()
+        shutil.copyfileobj(f, sys.stdout.buffer)
+    sys.stdout.flush()
     
     return elapsed
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Measure LSM-Tree bulk loading performance')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Generate fresh temporary data files instead of reusing cached ones')
+    args = parser.parse_args()
+    
     # Test data sizes (10MB, 50MB, 100MB, 200MB)
     data_sizes = [
         10 * 1024 * 1024,    # 10 MB
@@ -245,13 +352,15 @@ def main():
         print(f"TESTING WITH {data_size/1024/1024:.2f}MB DATA")
         print(f"{'='*80}")
         
-        # Create temporary test data file
-        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as temp_file:
-            test_data_file = temp_file.name
-        
+        test_data_file = None
         try:
-            # Generate the test data
-            generate_test_data(data_size, test_data_file)
+            if args.no_cache:
+                # Create and generate a temporary test data file
+                with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as temp_file:
+                    test_data_file = temp_file.name
+                generate_test_data(data_size, test_data_file)
+            else:
+                test_data_file = cached_test_data(data_size)
             
             # Test the loading performance
             elapsed = test_loading_performance(test_data_file)
@@ -265,8 +374,8 @@ def main():
                 print(f"Throughput: {throughput:.2f}MB/s")
             
         finally:
-            # Clean up
-            if os.path.exists(test_data_file):
+            # Clean up; cached data files are kept for the next run
+            if args.no_cache and test_data_file and os.path.exists(test_data_file):
                 os.unlink(test_data_file)
             cleanup_processes()
     